@@ -486,8 +486,12 @@ def save_last_generation_path(output_dir: str):
     # Получаем только имя папки
     folder_name = os.path.basename(output_dir)
     
-    with open(last_gen_file, 'w', encoding='utf-8') as f:
+    # Пишем во временный файл и атомарно подменяем указатель,
+    # чтобы параллельный запуск не прочитал пустой/недописанный файл
+    tmp_file = last_gen_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
         f.write(folder_name)
+    os.replace(tmp_file, last_gen_file)
 
 
 def get_last_generation_path() -> str | None:
@@ -8,6 +8,7 @@ import os
 import sys
 import shutil
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any  # <-- ИСПРАВЛЕНО: добавлены типы
@@ -23,6 +24,7 @@ from src.profiling.artifacts import (
     validate_artifact_structure,
     get_artifact_summary
 )
+from src.profiling.artifacts import artifact_manager as artifact_manager_module
 
 
 class ArtifactManagerTests:
@@ -484,6 +486,169 @@ class ArtifactManagerTests:
             self._record_test_result(test_name, False, error=str(e))
             return None
     
+    def test_streamed_json(self) -> None:
+        """Тест потоковой записи JSON: файл совпадает с orjson.dumps всего документа."""
+        test_name = "streamed_json"
+        print(f"\n🧪 ТЕСТ: {test_name}")
+        print("-" * 40)
+        
+        try:
+            am = ArtifactManager(
+                base_dir=str(self.current_run_dir / "test_streamed"),
+                adapter_name="test_streamed",
+                overwrite=True
+            )
+            
+            cases: Dict[str, Dict[str, Any]] = {
+                "empty_dict": {},
+                "empty_tests": {"run_meta": {"adapter": "x"}, "tests": []},
+                "none_tests": {"run_meta": {"adapter": "x"}, "tests": None},
+                "newlines": {
+                    "tests": [{"message": "строка 1\nстрока 2", "nested": {"text": "a\n\nb"}}],
+                    "note": "конец\n",
+                },
+                "sets": {
+                    "tests": [{"elements": {"B", "A"}}, {"elements": frozenset()}],
+                    "frame": {"C", "A", "B"},
+                },
+                "summary_like": {
+                    "run_meta": {"adapter": "our", "executed_tests": 2},
+                    "totals": {"success": 2, "failed": 0},
+                    "tests": [
+                        {"test_name": f"tiny_{i:03d}", "steps": {"step1": {"samples": [0.1, 0.2]}}, "errors": []}
+                        for i in range(2)
+                    ],
+                    "statistics": {"steps": {}, "errors": {}},
+                },
+            }
+            
+            for case_name, data in cases.items():
+                path = am.save_json_streamed(f"{case_name}.json", data, "tests", root_dir=True)
+                written = path.read_bytes()
+                if artifact_manager_module.HAS_ORJSON:
+                    import orjson
+                    expected = orjson.dumps(
+                        data,
+                        default=artifact_manager_module._orjson_default,
+                        option=artifact_manager_module._ORJSON_OPTIONS,
+                    )
+                    assert written == expected, f"{case_name}: вывод отличается от orjson.dumps"
+                else:
+                    # Без orjson - запись через save_json: проверяем только содержимое
+                    json.loads(written.decode("utf-8"))
+                print(f"  ✓ {case_name}: {len(written)} байт")
+            
+            details: Dict[str, Any] = {
+                "cases": list(cases.keys()),
+                "compared_with_orjson": artifact_manager_module.HAS_ORJSON
+            }
+            
+            self._record_test_result(test_name, True, details=details)
+            
+        except Exception as e:
+            self._record_test_result(test_name, False, error=str(e))
+    
+    def test_concurrent_append_jsonl(self) -> None:
+        """Тест дозаписи JSONL из нескольких потоков одновременно."""
+        test_name = "concurrent_append_jsonl"
+        print(f"\n🧪 ТЕСТ: {test_name}")
+        print("-" * 40)
+        
+        try:
+            am = ArtifactManager(
+                base_dir=str(self.current_run_dir / "test_jsonl"),
+                adapter_name="test_jsonl",
+                overwrite=True
+            )
+            
+            threads_count, batches, batch_size = 8, 25, 10
+            start = threading.Barrier(threads_count)
+            
+            def _writer(writer_id: int) -> None:
+                start.wait()
+                for batch in range(batches):
+                    am.append_jsonl("iterations.jsonl", [
+                        {"writer": writer_id, "batch": batch, "index": i, "payload": "x" * 200}
+                        for i in range(batch_size)
+                    ])
+            
+            threads = [threading.Thread(target=_writer, args=(i,)) for i in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            path = am.get_path("iterations.jsonl")
+            lines = path.read_text(encoding="utf-8").splitlines()
+            records = [json.loads(line) for line in lines]
+            
+            expected_count = threads_count * batches * batch_size
+            assert len(records) == expected_count, f"Записей {len(records)}, ожидалось {expected_count}"
+            keys = {(r["writer"], r["batch"], r["index"]) for r in records}
+            assert len(keys) == expected_count, "Записи потеряны или продублированы"
+            
+            print(f"  ✓ {len(records)} записей из {threads_count} потоков")
+            
+            details: Dict[str, Any] = {
+                "threads": threads_count,
+                "records": len(records)
+            }
+            
+            self._record_test_result(test_name, True, details=details)
+            
+        except Exception as e:
+            self._record_test_result(test_name, False, error=str(e))
+    
+    def test_non_finite_json(self) -> None:
+        """Тест записи NaN/±Infinity: с orjson - null (строгий JSON), без него - как в stdlib json."""
+        test_name = "non_finite_json"
+        print(f"\n🧪 ТЕСТ: {test_name}")
+        print("-" * 40)
+        
+        try:
+            am = ArtifactManager(
+                base_dir=str(self.current_run_dir / "test_non_finite"),
+                adapter_name="test_non_finite",
+                overwrite=True
+            )
+            
+            data: Dict[str, Any] = {
+                "std": float("nan"),
+                "tests": [{"max": float("inf"), "min": float("-inf"), "mean": 1.5}],
+            }
+            
+            def _strict_constant(name: str) -> Any:
+                raise ValueError(f"Нестрогий JSON: {name}")
+            
+            written = {
+                "save_json": am.save_json("save_json.json", data, root_dir=True),
+                "save_json_streamed": am.save_json_streamed("streamed.json", data, "tests", root_dir=True),
+                "append_jsonl": am.append_jsonl("records.jsonl", [data]),
+            }
+            
+            for method, path in written.items():
+                text = path.read_text(encoding="utf-8")
+                if artifact_manager_module.HAS_ORJSON:
+                    loaded = json.loads(text.splitlines()[0] if path.suffix == ".jsonl" else text,
+                                        parse_constant=_strict_constant)
+                    assert loaded["std"] is None, f"{method}: NaN записан не как null"
+                    assert loaded["tests"][0]["max"] is None, f"{method}: Infinity записан не как null"
+                    assert loaded["tests"][0]["min"] is None, f"{method}: -Infinity записан не как null"
+                    assert loaded["tests"][0]["mean"] == 1.5, f"{method}: конечное значение искажено"
+                else:
+                    assert "NaN" in text and "Infinity" in text, f"{method}: stdlib json должен писать NaN/Infinity"
+                print(f"  ✓ {method}")
+            
+            details: Dict[str, Any] = {
+                "methods": list(written.keys()),
+                "non_finite_as_null": artifact_manager_module.HAS_ORJSON
+            }
+            
+            self._record_test_result(test_name, True, details=details)
+            
+        except Exception as e:
+            self._record_test_result(test_name, False, error=str(e))
+    
     def run_all_tests(self) -> bool:  # <-- ИСПРАВЛЕНО: указан возвращаемый тип
         """Запускает все тесты."""
         print("🚀 ЗАПУСК ТЕСТОВ ARTIFACT MANAGER")
@@ -497,6 +662,9 @@ class ArtifactManagerTests:
         self.test_archive_creation()
         self.test_session_info()
         self.test_file_listing()
+        self.test_streamed_json()
+        self.test_concurrent_append_jsonl()
+        self.test_non_finite_json()
         
         # Сохраняем результаты
         self._save_test_results()
@@ -5,6 +5,7 @@
 Тестирует ВСЕ методы адаптера с валидацией и записью результатов
 """
 
+import itertools
 import sys
 import os
 import json
@@ -138,7 +139,7 @@ class OurAdapterTester:
             ("data содержит bpas", "bpas" in data),
             ("data содержит original_dass", "original_dass" in data),
             ("bpas это список", isinstance(data.get("bpas"), list)),
-            ("frame это set", isinstance(data.get("frame"), set)),
+            ("frame это frozenset", isinstance(data.get("frame"), frozenset)),
             ("2 источника", len(data.get("bpas", [])) == 2)
         ]
         
@@ -795,6 +796,86 @@ class OurAdapterTester:
         
         return all_ok
     
+    def test_08_batch_belief_plausibility(self) -> bool:
+        """Тест пакетного вычисления Belief/Plausibility"""
+        test_dass = self._create_test_dass()
+        data = self.adapter.load_from_dass(test_dass)
+        
+        all_ok = True
+        events = ["A", "B", "C", "{A,B}", "{}", ["A", "B", "C"]]
+        
+        for source_idx, bpa in enumerate(data["bpas"]):
+            source_data = {"frame": data["frame"], "bpa": bpa}
+            
+            beliefs = self.adapter.calculate_belief_batch(source_data, events)
+            plausibilities = self.adapter.calculate_plausibility_batch(source_data, events)
+            joint = self.adapter.calculate_belief_plausibility_batch(source_data, events)
+            all_ok = self._assert_equal(
+                joint, (beliefs, plausibilities),
+                message="Совместный пакет Bel/Pl"
+            ) and all_ok
+            
+            for event, belief, plausibility in zip(events, beliefs, plausibilities):
+                expected_bel = self.adapter.calculate_belief(source_data, event)
+                expected_pl = self.adapter.calculate_plausibility(source_data, event)
+                
+                ok_bel = self._assert_equal(
+                    belief, expected_bel,
+                    message=f"Источник {source_idx + 1}: пакетный Bel({event})"
+                )
+                ok_pl = self._assert_equal(
+                    plausibility, expected_pl,
+                    message=f"Источник {source_idx + 1}: пакетный Pl({event})"
+                )
+                
+                if ok_bel and ok_pl:
+                    print(f"   ✓ Источник {source_idx + 1}, {event}: Bel={belief:.6f}, Pl={plausibility:.6f}")
+                else:
+                    all_ok = False
+        
+        return all_ok
+    
+    def test_09_batch_bitmask_path(self) -> bool:
+        """Тест пакетных Belief/Plausibility на большом BPA (битовые маски)"""
+        all_ok = True
+        # 5 элементов - проход по dict, 16 - одно слово маски, 70 - многословные маски
+        for frame_size, max_focal_size in ((5, 3), (16, 4), (70, 3)):
+            frame_elements = [f"E{i:02d}" for i in range(frame_size)]
+            focal_sets = [
+                frozenset(combo)
+                for size in range(0, max_focal_size)
+                for combo in itertools.combinations(frame_elements, size)
+            ]
+            total = sum(range(1, len(focal_sets) + 1))
+            bpa = {subset: (idx + 1) / total for idx, subset in enumerate(focal_sets)}
+            source_data = {"frame": set(frame_elements), "bpa": bpa}
+            
+            events = [[element] for element in frame_elements] + [frame_elements, frame_elements[:5]]
+            print(f"   Фрейм: {frame_size}, BPA: {len(bpa)} фокальных элементов, событий: {len(events)}")
+            
+            beliefs = self.adapter.calculate_belief_batch(source_data, events)
+            plausibilities = self.adapter.calculate_plausibility_batch(source_data, events)
+            joint = self.adapter.calculate_belief_plausibility_batch(source_data, events)
+            all_ok = self._assert_equal(
+                joint, (beliefs, plausibilities),
+                message="Совместный пакет Bel/Pl"
+            ) and all_ok
+            
+            for event, belief, plausibility in zip(events, beliefs, plausibilities):
+                ok_bel = self._assert_equal(
+                    belief, self.adapter.calculate_belief(source_data, event),
+                    message=f"Пакетный Bel({event})"
+                )
+                ok_pl = self._assert_equal(
+                    plausibility, self.adapter.calculate_plausibility(source_data, event),
+                    message=f"Пакетный Pl({event})"
+                )
+                all_ok = all_ok and ok_bel and ok_pl
+        
+        if all_ok:
+            print("   ✓ Все события совпадают с поэлементным расчетом")
+        return all_ok
+    
     # ==================== ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ====================
     
     def _convert_bpa_to_frozenset(self, bpa: Dict[str, float]) -> Dict[frozenset, float]:
@@ -840,6 +921,8 @@ class OurAdapterTester:
             ("05. Комбинирование Ягера", self.test_05_combine_sources_yager),
             ("06. Граничные случаи", self.test_06_edge_cases),
             ("07. Вспомогательные методы", self.test_07_helper_methods),
+            ("08. Пакетные Belief/Plausibility", self.test_08_batch_belief_plausibility),
+            ("09. Пакетные Belief/Plausibility на битовых масках", self.test_09_batch_bitmask_path),
         ]
         
         for test_name, test_func in tests:
@@ -173,6 +173,60 @@ def test_test_suite():
     return runner
 
 
+class PartialSupportAdapter(OurImplementationAdapter):
+    """Адаптер, не поддерживающий событие {B}: раннер должен записать для него 0.0."""
+    
+    UNSUPPORTED = frozenset({"B"})
+    
+    def __init__(self):
+        super().__init__()
+        self.requested_events = []
+    
+    def supported_events(self, data, events):
+        return [frozenset(event) != self.UNSUPPORTED for event in events]
+    
+    def calculate_belief_plausibility_batch(self, data, events):
+        self.requested_events.extend(frozenset(event) for event in events)
+        return super().calculate_belief_plausibility_batch(data, events)
+
+
+def test_unsupported_events():
+    """Тестирует нулевые Bel/Pl для событий, которые адаптер не поддерживает."""
+    print("\n🧪 ТЕСТИРОВАНИЕ НЕПОДДЕРЖИВАЕМЫХ СОБЫТИЙ")
+    print("=" * 50)
+    
+    test_data = create_simple_test()
+    
+    reference = UniversalBenchmarkRunner(
+        OurImplementationAdapter(),
+        results_dir="results/runner_test/supported_events_reference"
+    ).run_test(test_data=test_data, test_name="supported_events_reference", iterations=1)
+    
+    adapter = PartialSupportAdapter()
+    partial = UniversalBenchmarkRunner(
+        adapter,
+        results_dir="results/runner_test/supported_events_partial"
+    ).run_test(test_data=test_data, test_name="supported_events_partial", iterations=1)
+    
+    assert adapter.UNSUPPORTED not in adapter.requested_events, "Адаптер вызван для неподдерживаемого события"
+    
+    expected_iteration = reference["iterations"][0]
+    actual_iteration = partial["iterations"][0]
+    checked = 0
+    for step in ["step1", "step2", "step3", "step4"]:
+        expected_blocks = expected_iteration[step].get("sources", [expected_iteration[step]])
+        actual_blocks = actual_iteration[step].get("sources", [actual_iteration[step]])
+        for expected, actual in zip(expected_blocks, actual_blocks):
+            for measure in ["beliefs", "plausibilities"]:
+                assert list(actual[measure]) == list(expected[measure]), f"{step}: порядок ключей {measure} изменился"
+                for key, value in expected[measure].items():
+                    expected_value = 0.0 if key == "{B}" else value
+                    assert actual[measure][key] == expected_value, f"{step}.{measure}[{key}]: {actual[measure][key]} != {expected_value}"
+                    checked += 1
+    
+    print(f"\n✅ Проверено значений: {checked}, {{B}} = 0.0, остальные совпадают с полным расчетом")
+
+
 def main():
     """Основная функция тестирования."""
     print("🔬 ТЕСТИРОВАНИЕ UNIVERSAL_BENCHMARK_RUNNER")
@@ -185,6 +239,9 @@ def main():
         # Тест набора тестов
         test_test_suite()
         
+        # Тест неподдерживаемых адаптером событий
+        test_unsupported_events()
+        
         print("\n" + "=" * 60)
         print("✅ ВСЕ ТЕСТЫ ПРОЙДЕНЫ УСПЕШНО!")
         print("🎯 Раннер готов к использованию для бенчмаркинга!")
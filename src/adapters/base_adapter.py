@@ -2,11 +2,12 @@
 """
 Базовый абстрактный класс адаптера для теории Демпстера-Шейфера.
 Определяет единый интерфейс для всех реализаций.
-Только абстрактные методы - без реализации.
+Абстрактные методы - без реализации; пакетные методы имеют поэлементную
+реализацию по умолчанию, которую адаптеры могут ускорить.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Union, FrozenSet, Tuple
 
 
 class BaseDempsterShaferAdapter(ABC):
@@ -72,13 +73,13 @@ class BaseDempsterShaferAdapter(ABC):
     # ==================== ОСНОВНЫЕ ФУНКЦИИ ====================
     
     @abstractmethod
-    def calculate_belief(self, data: Any, event: Union[str, List[str]]) -> float:
+    def calculate_belief(self, data: Any, event: Union[str, List[str], FrozenSet[str]]) -> float:
         """
         Вычисляет функцию доверия Bel(A) для события.
         
         Args:
             data: Объект с загруженными данными
-            event: Событие в виде строки "{A,B}" или списка ["A", "B"]
+            event: Событие в виде строки "{A,B}", списка ["A", "B"] или frozenset
             
         Returns:
             Значение Belief (0..1)
@@ -86,19 +87,85 @@ class BaseDempsterShaferAdapter(ABC):
         pass
     
     @abstractmethod
-    def calculate_plausibility(self, data: Any, event: Union[str, List[str]]) -> float:
+    def calculate_plausibility(self, data: Any, event: Union[str, List[str], FrozenSet[str]]) -> float:
         """
         Вычисляет функцию правдоподобия Pl(A) для события.
         
         Args:
             data: Объект с загруженными данными
-            event: Событие в виде строки "{A,B}" или списка ["A", "B"]
+            event: Событие в виде строки "{A,B}", списка ["A", "B"] или frozenset
             
         Returns:
             Значение Plausibility (0..1)
         """
         pass
     
+    def calculate_belief_batch(self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]) -> List[float]:
+        """
+        Вычисляет Bel(A) для набора событий.
+        
+        По умолчанию вызывает calculate_belief для каждого события;
+        адаптеры могут переопределить метод, чтобы обойти BPA один раз.
+        
+        Args:
+            data: Объект с загруженными данными
+            events: Список событий (в формате calculate_belief)
+            
+        Returns:
+            Значения Belief в порядке events
+        """
+        return [self.calculate_belief(data, event) for event in events]
+    
+    def calculate_plausibility_batch(self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]) -> List[float]:
+        """
+        Вычисляет Pl(A) для набора событий.
+        
+        По умолчанию вызывает calculate_plausibility для каждого события;
+        адаптеры могут переопределить метод, чтобы обойти BPA один раз.
+        
+        Args:
+            data: Объект с загруженными данными
+            events: Список событий (в формате calculate_plausibility)
+            
+        Returns:
+            Значения Plausibility в порядке events
+        """
+        return [self.calculate_plausibility(data, event) for event in events]
+    
+    def calculate_belief_plausibility_batch(
+        self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Вычисляет Bel(A) и Pl(A) для набора событий одним вызовом.
+        
+        По умолчанию вызывает calculate_belief_batch и calculate_plausibility_batch;
+        адаптеры могут переопределить метод, чтобы обойти BPA один раз для обеих мер.
+        
+        Args:
+            data: Объект с загруженными данными
+            events: Список событий (в формате calculate_belief)
+            
+        Returns:
+            (значения Belief, значения Plausibility) в порядке events
+        """
+        return self.calculate_belief_batch(data, events), self.calculate_plausibility_batch(data, events)
+    
+    def supported_events(self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]) -> List[bool]:
+        """
+        Определяет, для каких событий адаптер умеет вычислять Bel/Pl.
+        
+        Вызывается один раз на тест; для неподдерживаемых событий раннер
+        записывает 0.0, не вызывая адаптер. По умолчанию поддерживаются все.
+        
+        Args:
+            data: Объект с загруженными данными
+            events: Список событий (в формате calculate_belief)
+            
+        Returns:
+            Маска поддержки в порядке events
+        """
+        return [True] * len(events)
+    
     # ==================== КОМБИНИРОВАНИЕ ДЕМПСТЕРА ====================
     
     @abstractmethod
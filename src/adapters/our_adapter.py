@@ -4,7 +4,7 @@
 Stateless реализация - не хранит состояние.
 """
 
-from typing import Dict, List, Any, Union, Set
+from typing import Dict, List, Any, Union, Set, FrozenSet, Tuple
 from .base_adapter import BaseDempsterShaferAdapter
 
 # Импортируем нашу реализацию
@@ -37,7 +37,8 @@ class OurImplementationAdapter(BaseDempsterShaferAdapter):
         """
         # Извлекаем фрейм
         frame_elements = dass_data["frame_of_discernment"]
-        frame = set(frame_elements)
+        # frozenset: фрейм не изменяется, а frozenset(frame) в ядре (Ω) возвращает тот же объект без копии
+        frame = frozenset(frame_elements)
         
         # Конвертируем BPA из DASS формата в наш формат
         bpas = []
@@ -67,7 +68,7 @@ class OurImplementationAdapter(BaseDempsterShaferAdapter):
             return len(data['bpas'])
         return 0
     
-    def calculate_belief(self, data: Any, event: Union[str, List[str]]) -> float:
+    def calculate_belief(self, data: Any, event: Union[str, List[str], FrozenSet[str]]) -> float:
         """
         Вычисляет функцию доверия Bel(A) для события.
         
@@ -92,7 +93,7 @@ class OurImplementationAdapter(BaseDempsterShaferAdapter):
         # Вычисляем Belief
         return ds.belief(event_set, bpa)
     
-    def calculate_plausibility(self, data: Any, event: Union[str, List[str]]) -> float:
+    def calculate_plausibility(self, data: Any, event: Union[str, List[str], FrozenSet[str]]) -> float:
         """
         Вычисляет функцию правдоподобия Pl(A) для события.
         """
@@ -109,6 +110,41 @@ class OurImplementationAdapter(BaseDempsterShaferAdapter):
         # Вычисляем Plausibility
         return ds.plausibility(event_set, bpa)
     
+    def calculate_belief_batch(self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]) -> List[float]:
+        """
+        Вычисляет Bel(A) для набора событий за один проход по BPA.
+        """
+        bpa = self._extract_bpa_from_data(data)
+        frame = self._extract_frame_from_data(data)
+        ds = DempsterShafer(frame)
+        
+        event_sets = [self._parse_event(event) for event in events]
+        return ds.belief_batch(event_sets, bpa)
+    
+    def calculate_plausibility_batch(self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]) -> List[float]:
+        """
+        Вычисляет Pl(A) для набора событий за один проход по BPA.
+        """
+        bpa = self._extract_bpa_from_data(data)
+        frame = self._extract_frame_from_data(data)
+        ds = DempsterShafer(frame)
+        
+        event_sets = [self._parse_event(event) for event in events]
+        return ds.plausibility_batch(event_sets, bpa)
+    
+    def calculate_belief_plausibility_batch(
+        self, data: Any, events: List[Union[str, List[str], FrozenSet[str]]]
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Вычисляет Bel(A) и Pl(A) для набора событий за один проход по BPA.
+        """
+        bpa = self._extract_bpa_from_data(data)
+        frame = self._extract_frame_from_data(data)
+        ds = DempsterShafer(frame)
+        
+        event_sets = [self._parse_event(event) for event in events]
+        return ds.belief_plausibility_batch(event_sets, bpa)
+    
     def combine_sources_dempster(self, data: Any) -> Dict[str, float]:
         """
         Комбинирует все источники по правилу Демпстера.
@@ -234,11 +270,13 @@ class OurImplementationAdapter(BaseDempsterShaferAdapter):
             return data['bpas']
         return []
     
-    def _parse_event(self, event: Union[str, List[str]]) -> set:
-        """Парсит событие в множество."""
+    def _parse_event(self, event: Union[str, List[str], FrozenSet[str]]) -> Union[set, frozenset]:
+        """Парсит событие в множество (готовый frozenset возвращается без копирования)."""
+        if isinstance(event, frozenset):
+            return event
         if isinstance(event, str):
             return set(self._parse_subset_str(event))
-        elif isinstance(event, list):
+        elif isinstance(event, (list, set)):
             return set(event)
         else:
             raise TypeError(f"Не поддерживаемый тип события: {type(event)}")
@@ -46,7 +46,7 @@ class PyDempsterShaferAdapter(BaseDempsterShaferAdapter):
     def load_from_dass(self, dass_data: Dict[str, Any]) -> Dict[str, Any]:
 
         frame_elements = dass_data["frame_of_discernment"]
-        frame = set(frame_elements)
+        frame = frozenset(frame_elements)
 
         bpas = []
         for source in dass_data["bba_sources"]:
@@ -0,0 +1,201 @@
+"""
+Битовое SoA-представление BPA для пакетных Belief/Plausibility.
+
+Фокальный элемент кодируется маской uint64 (бит i - i-й элемент фрейма),
+массы хранятся отдельным массивом float64. Тогда A ⊆ B сводится к
+(a & ~b) == 0, а A ∩ B ≠ ∅ - к (a & b) != 0. Фреймы шире 64 элементов
+кодируются несколькими словами: маски имеют форму (|BPA|, ceil(N/64)).
+
+Ядра компилируются numba, если она установлена; иначе используется
+векторизованный numpy. Суммирование в обоих вариантах идет строго по
+порядку фокальных элементов, поэтому результат совпадает с проходом по dict.
+"""
+
+from typing import Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+# Сколько элементов фрейма помещается в одно слово маски
+MAX_MASK_BITS = 64
+
+_WORD_MASK = (1 << MAX_MASK_BITS) - 1
+
+# Ограничение на размер промежуточного массива (событий x |BPA| x слов) для numpy-ядер
+_WIDE_CHUNK_CELLS = 1 << 22
+
+# Ниже этого числа проверок (|BPA| x |событий|) перевод в маски дороже прохода по dict
+MIN_BITMASK_PAIRS = 4096
+
+
+def build_element_bits(frame: Iterable[str]) -> Dict[str, int]:
+    """Бит (1 << i) для каждого элемента фрейма (в отсортированном порядке)."""
+    return {element: 1 << i for i, element in enumerate(sorted(frame))}
+
+
+def full_frame_mask(frame: Collection[str]) -> int:
+    """Маска Ω - все биты фрейма."""
+    return (1 << len(frame)) - 1
+
+
+def mask_words(frame: Collection[str]) -> int:
+    """Сколько слов uint64 нужно на маску подмножества фрейма."""
+    return max(1, -(-len(frame) // MAX_MASK_BITS))
+
+
+def _split_words(mask: int, words: int) -> List[int]:
+    """Разбивает маску на слова по 64 бита (младшее слово первым)."""
+    return [(mask >> (MAX_MASK_BITS * w)) & _WORD_MASK for w in range(words)]
+
+
+def encode_subset(subset: Iterable[str], element_bits: Dict[str, int]) -> int:
+    """Кодирует подмножество фрейма в битовую маску (KeyError для элементов вне фрейма)."""
+    return sum(map(element_bits.__getitem__, subset))
+
+
+def _encode_masks(subsets: Iterable[FrozenSet], count: int,
+                  element_bits: Dict[str, int], words: int) -> np.ndarray:
+    """Маски подмножеств: одномерный массив при words == 1, иначе (count, words)."""
+    if words == 1:
+        return np.fromiter(
+            (encode_subset(subset, element_bits) for subset in subsets),
+            dtype=np.uint64,
+            count=count,
+        )
+    return np.array(
+        [_split_words(encode_subset(subset, element_bits), words) for subset in subsets],
+        dtype=np.uint64,
+    ).reshape(count, words)
+
+
+def bpa_to_soa(bpa: Dict[FrozenSet, float], element_bits: Dict[str, int],
+               words: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """Переводит BPA в пару массивов (маски uint64, массы float64) в порядке BPA.
+
+    При words > 1 маски двумерные: (|BPA|, words).
+    """
+    masks = _encode_masks(bpa, len(bpa), element_bits, words)
+    masses = np.fromiter(bpa.values(), dtype=np.float64, count=len(bpa))
+    return masks, masses
+
+
+def encode_events(events: List[FrozenSet], element_bits: Dict[str, int],
+                  words: int = 1) -> np.ndarray:
+    """Маски событий одним массивом uint64 (при words > 1 - формы (|событий|, words))."""
+    return _encode_masks(events, len(events), element_bits, words)
+
+
+def _ordered_masked_sum(selected: np.ndarray, masses: np.ndarray) -> np.ndarray:
+    """Сумма выбранных масс по строкам в порядке BPA (cumsum последователен, в отличие от sum)."""
+    if masses.size == 0:
+        return np.zeros(selected.shape[0])
+    return np.cumsum(np.where(selected, masses, 0.0), axis=1)[:, -1]
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _belief_kernel(masks, masses, event_masks):
+        out = np.zeros(event_masks.shape[0])
+        for j in range(event_masks.shape[0]):
+            outside = ~event_masks[j]
+            total = 0.0
+            for i in range(masks.shape[0]):
+                if masks[i] & outside == 0:
+                    total += masses[i]
+            out[j] = total
+        return out
+
+    @numba.njit(cache=True)
+    def _plausibility_kernel(masks, masses, event_masks):
+        out = np.zeros(event_masks.shape[0])
+        for j in range(event_masks.shape[0]):
+            event_mask = event_masks[j]
+            total = 0.0
+            for i in range(masks.shape[0]):
+                if masks[i] & event_mask != 0:
+                    total += masses[i]
+            out[j] = total
+        return out
+else:
+    def _chunked_kernel(masks, masses, event_masks, belief):
+        """Bel/Pl без numba: матрица (событий x |BPA|) строится блоками не больше _WIDE_CHUNK_CELLS."""
+        out = np.zeros(event_masks.shape[0])
+        step = max(1, _WIDE_CHUNK_CELLS // max(1, masks.shape[0]))
+        for start in range(0, event_masks.shape[0], step):
+            block = event_masks[start:start + step]
+            if belief:
+                selected = (masks[None, :] & ~block[:, None]) == 0
+            else:
+                selected = (masks[None, :] & block[:, None]) != 0
+            out[start:start + step] = _ordered_masked_sum(selected, masses)
+        return out
+
+    def _belief_kernel(masks, masses, event_masks):
+        return _chunked_kernel(masks, masses, event_masks, belief=True)
+
+    def _plausibility_kernel(masks, masses, event_masks):
+        return _chunked_kernel(masks, masses, event_masks, belief=False)
+
+
+def _wide_kernel(masks: np.ndarray, masses: np.ndarray, event_masks: np.ndarray,
+                 belief: bool) -> np.ndarray:
+    """Bel/Pl для многословных масок: broadcasting по событиям блоками ограниченного размера."""
+    out = np.zeros(event_masks.shape[0])
+    step = max(1, _WIDE_CHUNK_CELLS // max(1, masks.shape[0] * masks.shape[1]))
+    for start in range(0, event_masks.shape[0], step):
+        block = event_masks[start:start + step]
+        if belief:
+            selected = ((masks[None, :, :] & ~block[:, None, :]) == 0).all(axis=2)
+        else:
+            selected = ((masks[None, :, :] & block[:, None, :]) != 0).any(axis=2)
+        out[start:start + step] = _ordered_masked_sum(selected, masses)
+    return out
+
+
+def _run_belief(masks: np.ndarray, masses: np.ndarray, event_masks: np.ndarray) -> np.ndarray:
+    if masks.ndim == 2:
+        return _wide_kernel(masks, masses, event_masks, belief=True)
+    return _belief_kernel(masks, masses, event_masks)
+
+
+def _matches_mask(event_masks: np.ndarray, mask: int) -> np.ndarray:
+    """Какие из масок событий равны заданной маске."""
+    if event_masks.ndim == 2:
+        words = np.array(_split_words(mask, event_masks.shape[1]), dtype=np.uint64)
+        return (event_masks == words).all(axis=1)
+    return event_masks == np.uint64(mask)
+
+
+def belief_batch(masks: np.ndarray, masses: np.ndarray, event_masks: np.ndarray,
+                 full_mask: Optional[int] = None) -> List[float]:
+    """Bel для каждой маски события: сумма масс фокальных элементов, вложенных в событие.
+
+    Если передана маска всего фрейма, события Ω не проверяются поэлементно:
+    все закодированные фокальные элементы лежат во фрейме, и Bel(Ω) - сумма всех масс.
+    """
+    if full_mask is None:
+        return _run_belief(masks, masses, event_masks).tolist()
+
+    is_full = _matches_mask(event_masks, full_mask)
+    if not is_full.any():
+        return _run_belief(masks, masses, event_masks).tolist()
+
+    beliefs = np.empty(event_masks.shape[0])
+    beliefs[is_full] = sum(masses.tolist(), 0.0)
+    rest = ~is_full
+    if rest.any():
+        beliefs[rest] = _run_belief(masks, masses, event_masks[rest])
+    return beliefs.tolist()
+
+
+def plausibility_batch(masks: np.ndarray, masses: np.ndarray, event_masks: np.ndarray) -> List[float]:
+    """Pl для каждой маски события: сумма масс фокальных элементов, пересекающих событие."""
+    if masks.ndim == 2:
+        return _wide_kernel(masks, masses, event_masks, belief=False).tolist()
+    return _plausibility_kernel(masks, masses, event_masks).tolist()
@@ -2,7 +2,11 @@
 Ядро теории Демпстера-Шейфера - реализация основных функций из главы 2
 """
 import itertools
-from typing import Set, Dict, List, FrozenSet
+from typing import Set, Dict, List, FrozenSet, Optional, Tuple
+
+import numpy as np
+
+from . import bpa_bitmask
 
 class DempsterShafer:
     """Реализация основных функций теории Демпстера-Шейфера"""
@@ -41,7 +45,91 @@ class DempsterShafer:
         """Функция правдоподобия Pl(A) - формула (2.2)"""
         event_fs = frozenset(event)
         return sum(mass for subset, mass in bpa.items() if subset.intersection(event_fs))
+
+    def belief_batch(self, events: List[Set[str]], bpa: Dict[FrozenSet, float]) -> List[float]:
+        """Bel(A) сразу для набора событий за один проход по фокальным элементам BPA"""
+        events_fs = [frozenset(event) for event in events]
+        beliefs = [0.0] * len(events_fs)
+        # Одиночные события не требуют прохода по BPA: Bel({x}) = m({x}) + m(∅)
+        empty_mass = bpa.get(frozenset(), 0.0)
+        scanned = []
+        for idx, event_fs in enumerate(events_fs):
+            if len(event_fs) == 1:
+                beliefs[idx] = bpa.get(event_fs, 0.0) + empty_mass
+            else:
+                scanned.append((idx, event_fs))
+        if not scanned:
+            return beliefs
+        view = self._bitmask_view(bpa, [event_fs for _, event_fs in scanned])
+        if view is not None:
+            full_mask = bpa_bitmask.full_frame_mask(self.frame)
+            for (idx, _), value in zip(scanned, bpa_bitmask.belief_batch(*view, full_mask=full_mask)):
+                beliefs[idx] = value
+            return beliefs
+        for subset, mass in bpa.items():
+            for idx, event_fs in scanned:
+                if subset.issubset(event_fs):
+                    beliefs[idx] += mass
+        return beliefs
+
+    def plausibility_batch(self, events: List[Set[str]], bpa: Dict[FrozenSet, float]) -> List[float]:
+        """Pl(A) сразу для набора событий за один проход по фокальным элементам BPA"""
+        events_fs = [frozenset(event) for event in events]
+        view = self._bitmask_view(bpa, events_fs)
+        if view is not None:
+            return bpa_bitmask.plausibility_batch(*view)
+        plausibilities = [0.0] * len(events_fs)
+        for subset, mass in bpa.items():
+            for idx, event_fs in enumerate(events_fs):
+                if not subset.isdisjoint(event_fs):
+                    plausibilities[idx] += mass
+        return plausibilities
     
+    def belief_plausibility_batch(self, events: List[Set[str]],
+                                  bpa: Dict[FrozenSet, float]) -> Tuple[List[float], List[float]]:
+        """Bel(A) и Pl(A) для набора событий: один проход по BPA (или одно кодирование в битовые маски)"""
+        events_fs = [frozenset(event) for event in events]
+        view = self._bitmask_view(bpa, events_fs)
+        if view is not None:
+            full_mask = bpa_bitmask.full_frame_mask(self.frame)
+            return bpa_bitmask.belief_batch(*view, full_mask=full_mask), bpa_bitmask.plausibility_batch(*view)
+
+        beliefs = [0.0] * len(events_fs)
+        plausibilities = [0.0] * len(events_fs)
+        # Одиночные события не требуют проверки вложения: Bel({x}) = m({x}) + m(∅)
+        empty_mass = bpa.get(frozenset(), 0.0)
+        scanned = []
+        for idx, event_fs in enumerate(events_fs):
+            if len(event_fs) == 1:
+                beliefs[idx] = bpa.get(event_fs, 0.0) + empty_mass
+            else:
+                scanned.append((idx, event_fs))
+        indexed = list(enumerate(events_fs))
+        for subset, mass in bpa.items():
+            for idx, event_fs in scanned:
+                if subset.issubset(event_fs):
+                    beliefs[idx] += mass
+            for idx, event_fs in indexed:
+                if not subset.isdisjoint(event_fs):
+                    plausibilities[idx] += mass
+        return beliefs, plausibilities
+
+    def _bitmask_view(self, bpa: Dict[FrozenSet, float],
+                      events: List[FrozenSet]) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Маски/массы BPA и маски событий для битовых ядер; None, если задача мала
+        или встречаются элементы вне фрейма. Фреймы шире 64 элементов кодируются
+        многословными масками"""
+        if len(bpa) * len(events) < bpa_bitmask.MIN_BITMASK_PAIRS:
+            return None
+        element_bits = bpa_bitmask.build_element_bits(self.frame)
+        words = bpa_bitmask.mask_words(self.frame)
+        try:
+            masks, masses = bpa_bitmask.bpa_to_soa(bpa, element_bits, words)
+            event_masks = bpa_bitmask.encode_events(events, element_bits, words)
+        except KeyError:
+            return None
+        return masks, masses, event_masks
+
     def dempster_combine(self, bpa1: Dict[FrozenSet, float], bpa2: Dict[FrozenSet, float]) -> Dict[FrozenSet, float]:
         """Правило комбинирования Демпстера - раздел 2.6.1"""
         # Вычисляем конфликт K
@@ -94,12 +182,18 @@ class DempsterShafer:
     
     def discount(self, bpa: Dict[FrozenSet, float], alpha: float) -> Dict[FrozenSet, float]:
         """Правило дисконтирования - раздел 2.6.2"""
+        omega = frozenset(self.frame)
+        if alpha == 0:
+            # (1 - 0) * m = m: массы копируются без пересчета, Ω получает нулевую добавку
+            discounted = dict(bpa)
+            discounted[omega] = discounted.get(omega, 0.0) + alpha
+            return discounted
+
         discounted = {}
         for subset, mass in bpa.items():
             discounted[subset] = (1 - alpha) * mass
         
         # Добавляем массу для универсального множества
-        omega = frozenset(self.frame)
         discounted[omega] = discounted.get(omega, 0.0) + alpha
         return discounted
     
@@ -10,6 +10,7 @@ import platform
 import re
 import shutil
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -17,8 +18,66 @@ import logging
 
 from ..path_sanitizer import sanitize_payload_paths, sanitize_text_paths
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger("ArtifactManager")
 
+# orjson пишет только строгий JSON: NaN и ±Infinity (например, std пустой выборки или
+# деление на ноль в метриках) сохраняются как null, тогда как stdlib json писал NaN/Infinity.
+# Это касается save_json, save_json_streamed и append_jsonl; fallback на stdlib json сохраняет старое поведение.
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Сериализует типы, которые orjson не знает (множества -> отсортированный список)."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _read_json_file(file_path: Path) -> tuple:
+    """Читает JSON-файл: (данные, прочитан ли он orjson).
+
+    orjson не принимает NaN/Infinity, которые мог записать stdlib json, - такие файлы читаются через json.
+    """
+    raw = file_path.read_bytes()
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8")), False
+
+
+def _write_streamed_json(f, data: Dict[str, Any], stream_key: str) -> None:
+    """Пишет dict как orjson с indent=2, кодируя список data[stream_key] поэлементно.
+
+    Вложенные значения сдвигаются заменой переводов строк (внутри JSON-строк
+    они экранированы), поэтому файл совпадает с orjson.dumps всего документа.
+    """
+    def _dumps(value: Any, depth: int) -> bytes:
+        return orjson.dumps(value, default=_orjson_default, option=_ORJSON_OPTIONS).replace(b"\n", b"\n" + b"  " * depth)
+
+    if not data:
+        f.write(b"{}")
+        return
+    f.write(b"{")
+    for i, (key, value) in enumerate(data.items()):
+        f.write((b",\n  " if i else b"\n  ") + orjson.dumps(key) + b": ")
+        if key == stream_key and value:
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write((b",\n    " if j else b"\n    ") + _dumps(item, 2))
+            f.write(b"\n  ]")
+        else:
+            f.write(_dumps(value, 1))
+    f.write(b"\n}")
+
 
 class ArtifactManager:
     """
@@ -60,6 +119,8 @@ class ArtifactManager:
             self.run_id = self._sanitize_name(run_id)
 
         self.run_dir = self.base_dir / self.adapter_name / self.run_id
+        # Запись артефактов может идти из нескольких потоков: дозапись в общий JSONL сериализуется
+        self._append_lock = threading.Lock()
 
         self._setup_directory(overwrite)
         self._create_subdirectories()
@@ -180,16 +241,86 @@ class ArtifactManager:
         root_dir: bool = False,
         indent: int = 2,
     ) -> Path:
-        """Сохраняет данные в JSON файл."""
+        """Сохраняет данные в JSON файл.
+
+        Через orjson NaN и ±Infinity записываются как null (строгий JSON), а не NaN/Infinity, как в stdlib json.
+        """
         filepath = self.get_path(filename, subdir, root_dir)
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        # orjson кодирует весь документ в один буфер и пишет его одним вызовом;
+        # stdlib json остается fallback-ом (нет orjson, другой indent, неподдерживаемые типы)
+        payload = None
+        if HAS_ORJSON and indent == 2:
+            try:
+                payload = orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                payload = None
+
+        if payload is not None:
+            with open(filepath, "wb") as f:
+                f.write(payload)
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+
+        logger.debug("💾 Сохранен JSON: %s", filepath)
+        return filepath
+
+    def save_json_streamed(
+        self,
+        filename: str,
+        data: Dict[str, Any],
+        stream_key: str,
+        subdir: Optional[str] = None,
+        root_dir: bool = False,
+    ) -> Path:
+        """Сохраняет JSON (indent=2), сериализуя список data[stream_key] по одному элементу.
+
+        В памяти одновременно держится закодированный элемент, а не буфер всего документа.
+        """
+        if not HAS_ORJSON:
+            # json.dump и так пишет в файл частями
+            return self.save_json(filename, data, subdir=subdir, root_dir=root_dir)
+
+        filepath = self.get_path(filename, subdir, root_dir)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(filepath, "wb") as f:
+                _write_streamed_json(f, data, stream_key)
+        except TypeError:
+            # Тип, неизвестный orjson: файл перезаписывается через stdlib json
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
         logger.debug("💾 Сохранен JSON: %s", filepath)
         return filepath
 
+    def append_jsonl(
+        self,
+        filename: str,
+        records: List[Dict[str, Any]],
+        subdir: Optional[str] = None,
+    ) -> Path:
+        """Дописывает записи в JSONL-файл (одна компактная JSON-строка на запись)."""
+        filepath = self.get_path(filename, subdir)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        if HAS_ORJSON:
+            lines = [
+                orjson.dumps(record, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+                for record in records
+            ]
+        else:
+            lines = [json.dumps(record, ensure_ascii=False).encode("utf-8") for record in records]
+
+        payload = b"".join(line + b"\n" for line in lines)
+        with self._append_lock, open(filepath, "ab") as f:
+            f.write(payload)
+
+        logger.debug("💾 Дописано %d записей в JSONL: %s", len(records), filepath)
+        return filepath
+
     def save_text(self, filename: str, content: str, subdir: Optional[str] = None) -> Path:
         """Сохраняет текстовый файл."""
         filepath = self.get_path(filename, subdir)
@@ -257,11 +388,27 @@ class ArtifactManager:
 
         return self.save_json(filename, enhanced_metrics, subdir)
 
-    def save_test_input(self, test_data: Dict[str, Any], test_name: str) -> Path:
-        """Сохраняет входные данные теста."""
+    def save_test_input(
+        self,
+        test_data: Optional[Dict[str, Any]],
+        test_name: str,
+        source_path: Optional[Union[str, Path]] = None,
+    ) -> Path:
+        """Сохраняет входные данные теста.
+
+        Если известен исходный JSON-файл теста, он копируется как есть
+        (без повторного кодирования test_data; test_data тогда может быть None).
+        """
         safe_test_name = self._sanitize_name(test_name)
         filename = f"{safe_test_name}_input.json"
-        return self.save_json(filename, test_data, subdir="input")
+        if source_path is None:
+            return self.save_json(filename, test_data, subdir="input")
+
+        filepath = self.get_path(filename, "input")
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source_path, filepath)
+        logger.debug("📋 Скопирован вход теста: %s -> %s", source_path, filepath)
+        return filepath
 
     def save_test_results(self, results: Dict[str, Any], test_name: str) -> Path:
         """Сохраняет результаты вычислений Демпстера-Шейфера."""
@@ -396,7 +543,7 @@ class ArtifactManager:
             "errors": 0,
         }
 
-        text_exts = {".txt", ".log", ".html", ".htm", ".stderr", ".stdout"}
+        text_exts = {".txt", ".log", ".html", ".htm", ".stderr", ".stdout", ".jsonl"}
 
         for file_path in self.run_dir.rglob("*"):
             if not file_path.is_file():
@@ -406,14 +553,16 @@ class ArtifactManager:
             try:
                 if suffix == ".json":
                     stats["json_files_checked"] += 1
-                    original_text = file_path.read_text(encoding="utf-8")
-                    data = json.loads(original_text)
+                    data, via_orjson = _read_json_file(file_path)
                     sanitized = sanitize_payload_paths(data)
                     if sanitized != data:
-                        file_path.write_text(
-                            json.dumps(sanitized, indent=2, ensure_ascii=False),
-                            encoding="utf-8",
-                        )
+                        if via_orjson:
+                            file_path.write_bytes(orjson.dumps(sanitized, option=_ORJSON_OPTIONS))
+                        else:
+                            file_path.write_text(
+                                json.dumps(sanitized, indent=2, ensure_ascii=False),
+                                encoding="utf-8",
+                            )
                         stats["json_files_updated"] += 1
                     continue
 
@@ -97,16 +97,13 @@ class SystemCollector:
         
         # 4. CPU время (если доступен psutil)
         cpu_time_before = None
-        cpu_percent_before = None
         if HAS_PSUTIL:
             try:
                 process = psutil.Process()
                 cpu_time_before = process.cpu_times()
-                cpu_percent_before = process.cpu_percent(interval=None)
             except Exception as e:
                 print(f"⚠️  Ошибка получения CPU метрик: {e}")
                 cpu_time_before = None
-                cpu_percent_before = None
         
         # === ВЫПОЛНЕНИЕ ФУНКЦИИ ===
         
@@ -145,7 +142,6 @@ class SystemCollector:
             try:
                 process = psutil.Process()
                 cpu_time_after = process.cpu_times()
-                cpu_percent_after = process.cpu_percent(interval=None)
                 
                 # Проверяем что значения не None
                 user_time_diff = 0.0
@@ -158,8 +154,11 @@ class SystemCollector:
                 if hasattr(cpu_time_after, 'system') and hasattr(cpu_time_before, 'system'):
                     system_time_diff = (cpu_time_after.system - cpu_time_before.system) * 1000
                 
-                if cpu_percent_after is not None and cpu_percent_before is not None:
-                    cpu_percent_value = max(0, cpu_percent_after - cpu_percent_before)
+                # Загрузка CPU за вызов - доля процессорного времени от wall time в том же окне
+                # (process_time, а не тиковые cpu_times, снятые за пределами замера)
+                wall_time_ms = metrics["time"]["wall_time_ms"]
+                if wall_time_ms > 0:
+                    cpu_percent_value = 100.0 * metrics["time"]["cpu_time_ms"] / wall_time_ms
                 
                 cpu_metrics = {
                     "user_time_ms": user_time_diff,
@@ -343,7 +343,8 @@ class ProfilingBenchmarkRunner(UniversalBenchmarkRunner):
         return iteration_results
     
     def run_test(self, test_data: Dict[str, Any], test_name: str,
-                iterations: int = 3, alphas: Optional[List[float]] = None) -> Dict[str, Any]:
+                iterations: int = 3, alphas: Optional[List[float]] = None,
+                input_path: Optional[str] = None) -> Dict[str, Any]:
         """Запускает тест с профилированием.
 
         iterations интерпретируется как количество повторов каждого шага
@@ -364,13 +365,17 @@ class ProfilingBenchmarkRunner(UniversalBenchmarkRunner):
         }
         
         loaded_data = self.adapter.load_from_dass(test_data)
+        self._test_context = self._build_test_context(loaded_data)
+        test_results["metadata"]["omega_event"] = self._test_context.omega_event
 
         # Сохраняем входные данные теста
-        self.artifact_manager.save_test_input(test_data, test_name)
+        self.artifact_manager.save_test_input(test_data, test_name, source_path=input_path)
         
         if alphas is None:
-            sources_count = self.adapter.get_sources_count(loaded_data)
-            alphas = [0.1] * sources_count
+            alphas = [0.1] * len(self._test_context.sources)
+
+        if self.warmup:
+            self._warmup(loaded_data, alphas)
         
         iteration_results = self._run_single_iteration(
             loaded_data=loaded_data,
@@ -383,7 +388,7 @@ class ProfilingBenchmarkRunner(UniversalBenchmarkRunner):
         test_results["iterations"].append(iteration_results)
 
         self._save_test_results(test_results, test_name)
-        self.results.append(test_results)
+        self.results.append(self._summary_view(test_results))
         
         return test_results
 
@@ -423,6 +428,8 @@ class ProfilingBenchmarkRunner(UniversalBenchmarkRunner):
     
     def cleanup(self):
         """Очистка ресурсов"""
+        # Санитизация должна видеть все артефакты, включая еще не дописанные в фоне
+        self.flush_artifacts()
         if self.sanitize_paths:
             try:
                 self.artifact_manager.sanitize_saved_artifacts()
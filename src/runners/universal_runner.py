@@ -3,14 +3,21 @@
 Выполняет 4-шаговый процесс тестирования и собирает метрики производительности.
 """
 
+import gc
+import io
 import os
 import json
+import multiprocessing
 import time
 import tracemalloc
-import statistics
 import sys
 import psutil
-from typing import Dict, List, Any, Optional, Tuple, Callable
+import numpy as np
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterator, FrozenSet, MutableMapping
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +25,237 @@ from ..adapters.base_adapter import BaseDempsterShaferAdapter
 from ..profiling.artifacts import ArtifactManager
 
 
+# Статусы шагов/тестов и ключи шагов: интернированы, чтобы сравнения ключей
+# словарей в горячих циклах сводки шли по указателю
+STATUS_SUCCESS = sys.intern("success")
+STATUS_FAILED = sys.intern("failed")
+STATUS_FULL_CONFLICT = sys.intern("full_conflict")
+STATUS_NOT_SUPPORTED = sys.intern("not_supported")
+STEP_KEYS: Tuple[str, ...] = tuple(sys.intern(key) for key in ("step1", "step2", "step3", "step4"))
+
+# Общая (неизменяемая по соглашению) заготовка статистики для шагов без успешных замеров
+_EMPTY_STATS: Dict[str, float] = {"sample_count": 0, "min": 0.0, "max": 0.0, "mean": 0.0, "median": 0.0, "std": 0.0}
+_EMPTY_SAMPLES: Dict[str, Dict[str, float]] = {
+    "time_total_ms": _EMPTY_STATS,
+    "time_per_repeat_ms": _EMPTY_STATS,
+}
+
+# Потоки фоновой записи артефактов: файлы разных тестов пишутся параллельно (GIL отпускается на I/O)
+_ARTIFACT_WRITERS = 4
+
+# Сколько тестовых файлов читается/парсится заранее, пока выполняется текущий тест
+_TEST_PREFETCH_DEPTH = 4
+
+# Пулы воркеров стартуют через spawn: fork копировал бы блокировки, которые в этот момент
+# держат потоки записи артефактов и предзагрузки тестов (например, ArtifactManager._append_lock)
+_WORKER_START_METHOD = "spawn"
+
+# Общий для запуска JSONL-поток сырых итераций (одна строка на итерацию теста)
+_ITERATIONS_STREAM = "iterations.jsonl"
+
+
+def _load_test_file(test_file: str) -> Dict[str, Any]:
+    """Читает и парсит JSON-файл теста (выполняется в фоновом потоке)."""
+    with open(test_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Состояние процесса-воркера (пулы итераций и тестов): раннер без артефактов
+_WORKER_RUNNER: Optional["UniversalBenchmarkRunner"] = None
+_WORKER_LOADED_DATA: Dict[str, Any] = {}
+
+
+def _init_runner_worker(adapter_factory: Callable[[], BaseDempsterShaferAdapter],
+                        track_allocations: bool = False, freeze_gc: bool = True,
+                        warmup: bool = True) -> None:
+    """Инициализатор воркера: свежий адаптер из фабрики и раннер без артефактов (адаптер не пиклится)."""
+    global _WORKER_RUNNER
+    _WORKER_RUNNER = UniversalBenchmarkRunner._detached(adapter_factory(), track_allocations, freeze_gc, warmup)
+
+
+def _run_iteration_worker(test_data: Dict[str, Any], test_name: str,
+                          iteration_num: int, alphas: List[float]) -> Dict[str, Any]:
+    """Выполняет одну итерацию теста в процессе-воркере."""
+    runner = _WORKER_RUNNER
+    loaded_data = _WORKER_LOADED_DATA.get(test_name)
+    if loaded_data is None:
+        _WORKER_LOADED_DATA.clear()
+        loaded_data = _WORKER_LOADED_DATA[test_name] = runner.adapter.load_from_dass(test_data)
+        # Адаптер воркера тоже холодный: первая итерация теста в процессе идет после прогрева
+        if runner.warmup:
+            runner._warmup(loaded_data, alphas)
+        if runner.freeze_gc:
+            # Как в последовательном пути: одна сборка на тест (после прогрева), а не перед каждой итерацией
+            gc.collect()
+    # Сборщик отключен на время итерации (сборка уже выполнена при загрузке теста)
+    with _gc_paused() if runner.freeze_gc else nullcontext():
+        return runner._run_single_iteration(
+            loaded_data=loaded_data,
+            test_data=test_data,
+            iteration_num=iteration_num,
+            alphas=alphas,
+            test_name=test_name,
+        )
+
+
+def _run_test_worker(test_file: str, test_name: str, iterations: int) -> Dict[str, Any]:
+    """Читает и выполняет целый тест в процессе-воркере; сохранение остается в основном процессе."""
+    test_data = _load_test_file(test_file)
+    return _WORKER_RUNNER._compute_test(test_data, test_name, iterations, _suite_test_alphas(test_data))
+
+
+def _suite_test_alphas(test_data: Dict[str, Any]) -> List[float]:
+    """Проверяет формат теста из набора и возвращает коэффициенты дисконтирования по умолчанию."""
+    if "frame_of_discernment" not in test_data or "bba_sources" not in test_data:
+        raise ValueError("Неверный формат теста")
+    return [0.1] * len(test_data.get("bba_sources", []))
+
+
+@contextmanager
+def _timed(store: MutableMapping[str, Any], key: str) -> Iterator[None]:
+    """Записывает в store[key] время выполнения блока в мс (одна целочисленная разность perf_counter_ns)."""
+    start_ns = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        store[key] = (time.perf_counter_ns() - start_ns) / 1e6
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Отключает сборщик мусора на время блока (вложенные вызовы его не включают)."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@contextmanager
+def _gc_frozen() -> Iterator[None]:
+    """Одна полная сборка перед блоком, затем сборщик отключен до конца блока."""
+    gc.collect()
+    with _gc_paused():
+        yield
+
+
+# Дескриптор psutil текущего процесса для замеров RSS: создается лениво и
+# пересоздается по смене pid (воркеры пулов не читают дескриптор родителя)
+_PROCESS: Optional[psutil.Process] = None
+
+
+def _current_process() -> psutil.Process:
+    """Один psutil.Process на процесс вместо нового объекта на каждый замер."""
+    global _PROCESS
+    if _PROCESS is None or _PROCESS.pid != os.getpid():
+        _PROCESS = psutil.Process()
+    return _PROCESS
+
+
+def _rss_kb() -> int:
+    """Текущий RSS процесса в КБ: на Linux - чтением /proc/self/status, иначе через psutil."""
+    try:
+        with open("/proc/self/status", "rb") as status:
+            for line in status:
+                if line.startswith(b"VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return _current_process().memory_info().rss // 1024
+
+
+def _time_stats(values: List[float]) -> Dict[str, float]:
+    """min/max/mean/median/std (выборочное, ddof=1) по замерам времени одним numpy-массивом."""
+    arr = np.asarray(values, dtype=np.float64)
+    return {
+        "min": float(arr.min()),
+        "max": float(arr.max()),
+        "mean": float(arr.mean()),
+        "median": float(np.median(arr)),
+        "std": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
+    }
+
+
+def _parse_subset_str(subset_str: str) -> FrozenSet[str]:
+    """Парсит строку подмножества "{A,B}" во frozenset."""
+    if subset_str.startswith("{") and subset_str.endswith("}"):
+        subset_str = subset_str[1:-1]
+    if not subset_str:
+        return frozenset()
+    return frozenset(subset_str.split(","))
+
+
+class _SubsetCache(dict):
+    """Строка подмножества -> frozenset; промах парсится и запоминается.
+
+    Ключи BPA повторяются между шагами и итерациями теста, поэтому почти
+    каждое обращение - обычный поиск в dict без вызова Python-функции.
+    """
+    __slots__ = ()
+
+    def __missing__(self, subset_str: str) -> FrozenSet[str]:
+        subset = self[subset_str] = _parse_subset_str(subset_str)
+        return subset
+
+
+def _format_subset(subset: FrozenSet[str]) -> str:
+    """Строка подмножества "{A,B}" (элементы отсортированы, ∅ - "{}")."""
+    return "{" + ",".join(sorted(subset)) + "}"
+
+
+class _SubsetKeyCache(dict):
+    """frozenset -> строка подмножества; обратная к _SubsetCache таблица."""
+    __slots__ = ()
+
+    def __missing__(self, subset: FrozenSet[str]) -> str:
+        subset_str = self[subset] = _format_subset(subset)
+        return subset_str
+
+
+@dataclass(slots=True)
+class TestEntry:
+    """Запись о тесте в run_summary (в dict превращается только при сериализации)"""
+    test_name: str
+    status: str = STATUS_SUCCESS
+    frame_size: Optional[int] = None
+    sources_count: Optional[int] = None
+    input_ref: str = ""
+    result_ref: str = ""
+    iterations_count: int = 0
+    steps: Dict[str, Any] = field(default_factory=dict)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    total_time_ms: Dict[str, float] = field(default_factory=dict)
+    total_time_per_repeat_ms: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Поверхностная конвертация в dict (без deepcopy, в отличие от asdict)."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class TestContext:
+    """Производные от загруженных данных теста, построенные один раз на тест (не на итерацию)"""
+    loaded_data: Any
+    frame_elements: List[str]
+    omega: FrozenSet[str]
+    omega_event: str
+    events: Tuple[FrozenSet[str], ...]
+    event_keys: Tuple[str, ...]
+    sources: Tuple[Any, ...]
+    source_ids: Tuple[str, ...]
+    supported_events: Tuple[FrozenSet[str], ...]
+    supported_keys: Tuple[str, ...]
+    all_supported: bool
+    # Заготовка {ключ события: 0.0}: копия уже нужного размера, без перестроек хеш-таблицы
+    zero_measures: Dict[str, float]
+    # Разобранные строки подмножеств - общие для всех шагов и итераций теста
+    subset_cache: _SubsetCache = field(default_factory=_SubsetCache)
+    # Обратная таблица frozenset -> строка для BPA, возвращенных адаптером во frozenset-формате
+    subset_keys: _SubsetKeyCache = field(default_factory=_SubsetKeyCache)
+
+
 class UniversalBenchmarkRunner:
     """
     Универсальный раннер для тестирования адаптеров теории ДШ.
@@ -29,19 +267,47 @@ class UniversalBenchmarkRunner:
     4. Сохранение структурированных результатов
     """
     
-    def __init__(self, adapter: BaseDempsterShaferAdapter, 
-                 results_dir: str = "results/profiling"):
+    def __init__(self, adapter: Optional[BaseDempsterShaferAdapter] = None, 
+                 results_dir: str = "results/profiling",
+                 track_allocations: bool = False,
+                 freeze_gc: bool = True,
+                 adapter_factory: Optional[Callable[[], BaseDempsterShaferAdapter]] = None,
+                 warmup: bool = True):
         """
         Инициализация раннера.
         
         Args:
-            adapter: Адаптер для тестируемой библиотеки
+            adapter: Адаптер для тестируемой библиотеки (если не задан - создается adapter_factory)
             results_dir: Директория для сохранения результатов
+            track_allocations: Считать память шагов через tracemalloc (замедляет
+                сами шаги); по умолчанию - разница RSS процесса
+            freeze_gc: Одна сборка мусора перед итерациями теста и отключенный
+                сборщик на время итераций (вместо сборки после каждого шага)
+            adapter_factory: Пиклируемая фабрика адаптера для процессов-воркеров
+                (по умолчанию - класс адаптера без аргументов)
+            warmup: Один прогон всех шагов без замеров перед итерациями теста
+                (ленивые импорты, JIT-компиляция и кеши адаптера не попадают в итерацию 1)
         """
+        if adapter is None:
+            if adapter_factory is None:
+                raise ValueError("Нужно передать adapter или adapter_factory")
+            adapter = adapter_factory()
         self.adapter = adapter
+        self.adapter_factory = adapter_factory or type(adapter)
         self.adapter_name = adapter.benchmark_name
         self.results_dir = results_dir
         self.results = []
+        self.show_progress = True
+        self.track_allocations = track_allocations
+        self.freeze_gc = freeze_gc
+        self.warmup = warmup
+        self._test_context: Optional[TestContext] = None
+        # Внутри run_test_suite запись артефактов дожидается конца набора, а не каждого теста
+        self._in_suite = False
+        
+        # Фоновые писатели артефактов: запись JSON не блокирует выполнение следующего теста
+        self._io_pool = ThreadPoolExecutor(max_workers=_ARTIFACT_WRITERS, thread_name_prefix="artifact-writer")
+        self._io_futures: List[Future] = []
         
         # Создаем структуру артефактов: results/profiling/<library>/<timestamp>/
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -66,6 +332,8 @@ class UniversalBenchmarkRunner:
 
     def _render_inline_progress(self, text: str) -> None:
         """Печатает прогресс в текущей строке или fallback-строкой."""
+        if not self.show_progress:
+            return
         if self._supports_cr():
             print(f"\r{text}", end="", flush=True)
             return
@@ -73,18 +341,37 @@ class UniversalBenchmarkRunner:
 
     def _finish_inline_progress(self) -> None:
         """Завершает inline-печать переводом строки."""
-        if self._supports_cr():
+        if self.show_progress and self._supports_cr():
             print()
     
     def run_test(self, test_data: Dict[str, Any], 
              test_name: str,
              iterations: int = 3,
-             alphas: Optional[List[float]] = None) -> Dict[str, Any]:
+             alphas: Optional[List[float]] = None,
+             input_path: Optional[str] = None,
+             parallel_workers: int = 1) -> Dict[str, Any]:
         """
         Запускает один тест.
+        
+        input_path - исходный JSON-файл теста: вход копируется в артефакты
+        один раз на тест без повторной сериализации test_data.
+        parallel_workers > 1 - итерации 2..N выполняются в пуле процессов
+        (итерация 1 всегда последовательно, как прогрев).
+        Вне run_test_suite метод дожидается записи артефактов теста: ошибки
+        сохранения пробрасываются здесь, а не только из cleanup().
         """
         print(f"\n🧪 Тест: {test_name} (итераций: {iterations})")
-        
+
+        test_results = self._compute_test(test_data, test_name, iterations, alphas, parallel_workers)
+        self._store_test_results(test_results, test_name, test_data=test_data, input_path=input_path)
+        if not self._in_suite:
+            self.flush_artifacts()
+        return test_results
+
+    def _compute_test(self, test_data: Dict[str, Any], test_name: str, iterations: int,
+                      alphas: Optional[List[float]] = None,
+                      parallel_workers: int = 1) -> Dict[str, Any]:
+        """Вычислительная часть run_test: загрузка, итерации и агрегация (без записи артефактов)."""
         # Инициализация результатов
         test_results = {
             "metadata": {
@@ -99,46 +386,149 @@ class UniversalBenchmarkRunner:
             "aggregated": {}
         }
         
+        # RSS снимается только на границах теста: одна разница вместо замеров на каждом шаге
+        rss_before_kb = _rss_kb()
+
         # Загружаем данные через адаптер
         loaded_data = self.adapter.load_from_dass(test_data)
-
-        # Сохраняем вход теста как артефакт
-        self.artifact_manager.save_test_input(test_data, test_name)
+        self._test_context = self._build_test_context(loaded_data)
+        test_results["metadata"]["omega_event"] = self._test_context.omega_event
         
         # Определяем коэффициенты дисконтирования
         if alphas is None:
-            sources_count = self.adapter.get_sources_count(loaded_data)
-            alphas = [0.1] * sources_count
+            alphas = [0.1] * len(self._test_context.sources)
         
-        # Выполняем итерации
-        for i in range(iterations):
-            self._render_inline_progress(f"   ↻ Итерация {i+1}/{iterations}")
+        if self.warmup:
+            self._warmup(loaded_data, alphas)
 
-            iteration_results = self._run_single_iteration(
-                loaded_data=loaded_data,
+        # Выполняем итерации (при parallel_workers > 1 последовательно только первую)
+        serial_iterations = iterations if parallel_workers <= 1 else min(1, iterations)
+        with _gc_frozen() if self.freeze_gc else nullcontext():
+            for i in range(serial_iterations):
+                self._render_inline_progress(f"   ↻ Итерация {i+1}/{iterations}")
+
+                iteration_results = self._run_single_iteration(
+                    loaded_data=loaded_data,
+                    test_data=test_data,
+                    iteration_num=i+1,
+                    alphas=alphas,
+                    test_name=test_name
+                )
+                
+                test_results["iterations"].append(iteration_results)
+                self._render_inline_progress(f"   ✅ Итерация {i+1}/{iterations}")
+                self._finish_inline_progress()
+
+        if serial_iterations < iterations:
+            test_results["iterations"].extend(self._run_iterations_parallel(
                 test_data=test_data,
-                iteration_num=i+1,
+                test_name=test_name,
+                iteration_nums=range(serial_iterations + 1, iterations + 1),
                 alphas=alphas,
-                test_name=test_name
-            )
-            
-            test_results["iterations"].append(iteration_results)
-            self._render_inline_progress(f"   ✅ Итерация {i+1}/{iterations}")
-            self._finish_inline_progress()
+                workers=parallel_workers,
+            ))
         
+        test_results["metadata"]["rss_delta_kb"] = _rss_kb() - rss_before_kb
+
         # Агрегируем результаты
         test_results["aggregated"] = self._aggregate_iteration_results(
             test_results["iterations"]
         )
         
-        # Сохраняем сырые результаты
-        self._save_test_results(test_results, test_name)
+        return test_results
+
+    def _store_test_results(self, test_results: Dict[str, Any], test_name: str,
+                            test_data: Optional[Dict[str, Any]] = None,
+                            input_path: Optional[str] = None) -> None:
+        """Ставит в очередь запись входа и результатов теста и добавляет их в общие результаты."""
+        # Сохраняем вход теста как артефакт
+        self._submit_io(self.artifact_manager.save_test_input, test_data, test_name, source_path=input_path)
         
-        # Добавляем в общие результаты
-        self.results.append(test_results)
+        # Сохраняем сырые результаты: контейнеры для записи строятся здесь, а не в потоке писателя,
+        # поэтому писатель не обходит dict, который run_test вернул вызывающему коду
+        iteration_records, persisted_results = self._persisted_results(test_results, test_name)
+        self._submit_io(self._write_test_results, iteration_records, persisted_results, test_name)
         
-        return test_results
+        # Добавляем в общие результаты (без вычислительных данных - они уже уходят на диск)
+        self.results.append(self._summary_view(test_results))
+
+    @staticmethod
+    def _summary_view(test_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Облегченная копия результатов теста для сводного отчета.
+
+        Сводке нужны только метаданные, ошибка и метрики итераций; BPA и Bel/Pl
+        итераций (и их копия в aggregated.results) не держатся в памяти до конца прогона.
+        """
+        view = {key: value for key, value in test_results.items() if key not in ("iterations", "aggregated")}
+        view["iterations"] = [
+            {key: iteration[key] for key in ("iteration", "run", "performance") if key in iteration}
+            for iteration in test_results.get("iterations") or []
+        ]
+        return view
     
+    def _submit_io(self, func: Callable, *args, **kwargs) -> None:
+        """Ставит запись артефакта в очередь фонового писателя."""
+        self._io_futures.append(self._io_pool.submit(func, *args, **kwargs))
+
+    def flush_artifacts(self) -> None:
+        """Дожидается записи всех артефактов из очереди (ошибки записи пробрасываются)."""
+        futures, self._io_futures = self._io_futures, []
+        for future in futures:
+            future.result()
+
+    @classmethod
+    def _detached(cls, adapter: BaseDempsterShaferAdapter, track_allocations: bool = False,
+                  freeze_gc: bool = True, warmup: bool = True) -> "UniversalBenchmarkRunner":
+        """Раннер без директории артефактов - только для вычислений в процессах-воркерах."""
+        runner = cls.__new__(cls)
+        runner.adapter = adapter
+        runner.adapter_factory = type(adapter)
+        runner.adapter_name = adapter.benchmark_name
+        runner.results = []
+        runner.show_progress = False
+        runner.track_allocations = track_allocations
+        runner.freeze_gc = freeze_gc
+        runner.warmup = warmup
+        runner._test_context = None
+        runner._in_suite = False
+        return runner
+
+    def _run_iterations_parallel(self, test_data: Dict[str, Any], test_name: str,
+                                 iteration_nums: range, alphas: List[float],
+                                 workers: int) -> List[Dict[str, Any]]:
+        """Выполняет независимые итерации теста в multiprocessing.Pool (порядок итераций сохраняется)."""
+        self._render_inline_progress(
+            f"   ↻ Итерации {iteration_nums.start}-{iteration_nums.stop - 1} в {workers} процессах"
+        )
+        with multiprocessing.get_context(_WORKER_START_METHOD).Pool(
+            processes=min(workers, len(iteration_nums)),
+            initializer=_init_runner_worker,
+            initargs=(self.adapter_factory, self.track_allocations, self.freeze_gc, self.warmup),
+        ) as pool:
+            iteration_results = pool.starmap(
+                _run_iteration_worker,
+                [(test_data, test_name, num, alphas) for num in iteration_nums],
+            )
+        self._render_inline_progress(
+            f"   ✅ Итерации {iteration_nums.start}-{iteration_nums.stop - 1} в {workers} процессах"
+        )
+        self._finish_inline_progress()
+        return iteration_results
+
+    def _warmup(self, loaded_data: Any, alphas: List[float]) -> None:
+        """Прогон всех шагов без замеров: результаты и ошибки отбрасываются."""
+        for step, args in (
+            (self._execute_step1, (loaded_data,)),
+            (self._execute_step2, (loaded_data,)),
+            (self._execute_step3, (loaded_data, alphas)),
+            (self._execute_step4, (loaded_data,)),
+        ):
+            try:
+                step(*args)
+            except Exception:
+                # Ошибки шага (конфликт, неподдерживаемая операция) зафиксирует замеряемая итерация
+                pass
+
     def _run_single_iteration(self, 
                          loaded_data: Any,
                          test_data: Dict[str, Any],
@@ -199,52 +589,35 @@ class UniversalBenchmarkRunner:
         iteration_results["performance"]["step4"] = step4_metrics
         
         # Общая статистика по итерации
+        step_metrics = [step for step in iteration_results["performance"].values() if isinstance(step, dict)]
         iteration_results["performance"]["total"] = {
-            "time_total_ms": sum(
-                step["time_ms"] for step in iteration_results["performance"].values() 
-                if isinstance(step, dict) and "time_ms" in step
-            ),
-            "memory_peak_mb": max(
-                step.get("memory_peak_mb", 0) for step in iteration_results["performance"].values()
-                if isinstance(step, dict)
-            )
+            "time_total_ms": sum(step["time_ms"] for step in step_metrics if "time_ms" in step),
         }
+        # Пик памяти итерации - только из пиков шагов (tracemalloc), а не из RSS
+        step_peaks = [step["memory_peak_mb"] for step in step_metrics if "memory_peak_mb" in step]
+        if step_peaks:
+            iteration_results["performance"]["total"]["memory_peak_mb"] = max(step_peaks)
         
         return iteration_results
     
     def _execute_step1(self, loaded_data: Any) -> Dict[str, Any]:
         """Шаг 1: Исходные Belief/Plausibility для каждого источника"""
-        frame_elements = self.adapter.get_frame_of_discernment(loaded_data)
-        sources_count = self.adapter.get_sources_count(loaded_data)
+        ctx = self._get_test_context(loaded_data)
         
         results = {
-            "frame_elements": frame_elements,
+            "frame_elements": ctx.frame_elements,
             "sources": []
         }
         
         # Для каждого источника вычисляем Belief и Plausibility
-        for i in range(sources_count):
-            # Получаем данные для конкретного источника
-            source_data = self._get_source_data(loaded_data, i)
-            
+        # (данные источников нарезаны один раз на тест в контексте)
+        for source_id, source_data in zip(ctx.source_ids, ctx.sources):
+            beliefs, plausibilities = self._calculate_event_measures(source_data, ctx)
             source_results = {
-                "source_id": f"source_{i+1}",
-                "beliefs": {},
-                "plausibilities": {}
+                "source_id": source_id,
+                "beliefs": beliefs,
+                "plausibilities": plausibilities
             }
-            
-            # Для каждого одиночного элемента
-            for element in frame_elements:
-                belief = self.adapter.calculate_belief(source_data, element)
-                plausibility = self.adapter.calculate_plausibility(source_data, element)
-                
-                source_results["beliefs"][f"{{{element}}}"] = belief
-                source_results["plausibilities"][f"{{{element}}}"] = plausibility
-            
-            # Для всего фрейма (Ω)
-            omega = "{" + ",".join(sorted(frame_elements)) + "}"
-            source_results["beliefs"][omega] = self.adapter.calculate_belief(source_data, frame_elements)  # Bel(Ω) = 1.0
-            source_results["plausibilities"][omega] = self.adapter.calculate_plausibility(source_data, frame_elements)  # Pl(Ω) = 1.0
 
             results["sources"].append(source_results)
         
@@ -254,47 +627,15 @@ class UniversalBenchmarkRunner:
         """Шаг 2: Комбинирование всех источников по правилу Демпстера"""
         # Комбинируем все источники
         combined_bpa_str = self.adapter.combine_sources_dempster(loaded_data)
-        
-        # КОНВЕРТИРУЕМ строковый формат в формат нашего адаптера
-        combined_bpa = self._convert_string_bpa_to_frozenset(combined_bpa_str)
-        
-        # Создаем данные с комбинированным BPA для вычисления Belief/Plausibility
-        combined_data = self._create_combined_data(loaded_data, combined_bpa)
-        
-        frame_elements = self.adapter.get_frame_of_discernment(loaded_data)
-        
-        results = {
-            "combined_bpa": combined_bpa_str,  # Сохраняем в строковом формате
-            "beliefs": {},
-            "plausibilities": {}
-        }
-        
-        # Для каждого одиночного элемента
-        for element in frame_elements:
-            belief = self.adapter.calculate_belief(combined_data, element)
-            plausibility = self.adapter.calculate_plausibility(combined_data, element)
-            
-            results["beliefs"][f"{{{element}}}"] = belief
-            results["plausibilities"][f"{{{element}}}"] = plausibility
-        
-        # Для всего фрейма
-        omega = "{" + ",".join(sorted(frame_elements)) + "}"
-        results["beliefs"][omega] = self.adapter.calculate_belief(combined_data, frame_elements)
-        results["plausibilities"][omega] = self.adapter.calculate_plausibility(combined_data, frame_elements)
-        
-        return results
+        return self._finalize_combined(loaded_data, combined_bpa_str, self._get_test_context(loaded_data))
     
     def _execute_step3(self, loaded_data: Any, alphas: List[float]) -> Dict[str, Any]:
         """Шаг 3: Дисконтирование + комбинирование Демпстером"""
-        # Получаем количество источников
-        sources_count = self.adapter.get_sources_count(loaded_data)
+        ctx = self._get_test_context(loaded_data)
         
         # Применяем дисконтирование к каждому источнику с его alpha
         discounted_bpas_str = []
-        for i in range(sources_count):
-            # Получаем данные для конкретного источника
-            source_data = self._get_source_data(loaded_data, i)
-            
+        for i, source_data in enumerate(ctx.sources):
             # Применяем дисконтирование с alpha для этого источника
             alpha = alphas[i] if i < len(alphas) else 0.1
             
@@ -317,68 +658,90 @@ class UniversalBenchmarkRunner:
         
         # Комбинируем дисконтированные источники
         combined_bpa_str = self.adapter.combine_sources_dempster(discounted_data)
-        combined_bpa = self._convert_string_bpa_to_frozenset(combined_bpa_str)
-        
-        # Создаем данные с комбинированным BPA
-        combined_data = self._create_combined_data(discounted_data, combined_bpa)
-        
-        frame_elements = self.adapter.get_frame_of_discernment(loaded_data)
         
-        results = {
+        return {
             "discounted_bpas": discounted_bpas_str,  # Сохраняем в строковом формате
-            "combined_bpa": combined_bpa_str,
-            "beliefs": {},
-            "plausibilities": {}
+            **self._finalize_combined(discounted_data, combined_bpa_str, ctx),
         }
-        
-        # Для каждого элемента
-        for element in frame_elements:
-            belief = self.adapter.calculate_belief(combined_data, element)
-            plausibility = self.adapter.calculate_plausibility(combined_data, element)
-            
-            results["beliefs"][f"{{{element}}}"] = belief
-            results["plausibilities"][f"{{{element}}}"] = plausibility
-        
-        # Для всего фрейма
-        omega = "{" + ",".join(sorted(frame_elements)) + "}"
-        results["beliefs"][omega] = self.adapter.calculate_belief(combined_data, frame_elements)
-        results["plausibilities"][omega] = self.adapter.calculate_plausibility(combined_data, frame_elements)
-        
-        return results
     
     def _execute_step4(self, loaded_data: Any) -> Dict[str, Any]:
         """Шаг 4: Комбинирование всех источников по правилу Ягера"""
         # Комбинируем все источники по Ягеру
         combined_bpa_str = self.adapter.combine_sources_yager(loaded_data)
-        
-        # КОНВЕРТИРУЕМ строковый формат в формат frozenset
+        return self._finalize_combined(loaded_data, combined_bpa_str, self._get_test_context(loaded_data))
+    
+    def _finalize_combined(self, base_data: Any, combined_bpa_str: Dict[str, float],
+                           ctx: TestContext) -> Dict[str, Any]:
+        """Общий хвост шагов 2-4: Bel/Pl по комбинированному BPA.
+
+        Строковый BPA переводится во frozenset, подставляется в данные
+        (base_data - исходные или дисконтированные) и считается одним пакетом по событиям.
+        """
         combined_bpa = self._convert_string_bpa_to_frozenset(combined_bpa_str)
-        
-        # Создаем данные с комбинированным BPA
-        combined_data = self._create_combined_data(loaded_data, combined_bpa)
-        
-        frame_elements = self.adapter.get_frame_of_discernment(loaded_data)
-        
-        results = {
+        combined_data = self._create_combined_data(base_data, combined_bpa)
+        beliefs, plausibilities = self._calculate_event_measures(combined_data, ctx)
+        return {
             "combined_bpa": combined_bpa_str,  # Сохраняем в строковом формате
-            "beliefs": {},
-            "plausibilities": {}
+            "beliefs": beliefs,
+            "plausibilities": plausibilities
         }
-        
-        # Для каждого элемента
-        for element in frame_elements:
-            belief = self.adapter.calculate_belief(combined_data, element)
-            plausibility = self.adapter.calculate_plausibility(combined_data, element)
-            
-            results["beliefs"][f"{{{element}}}"] = belief
-            results["plausibilities"][f"{{{element}}}"] = plausibility
-        
-        # Для всего фрейма
-        omega = "{" + ",".join(sorted(frame_elements)) + "}"
-        results["beliefs"][omega] = self.adapter.calculate_belief(combined_data, frame_elements)
-        results["plausibilities"][omega] = self.adapter.calculate_plausibility(combined_data, frame_elements)
-        
-        return results
+    
+    def _calculate_event_measures(self, data: Any,
+                                  ctx: TestContext) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Bel/Pl для одиночных элементов и Ω одним пакетом.
+
+        Считаются только события, поддерживаемые адаптером (маска из контекста);
+        остальные получают 0.0 без вызова адаптера.
+        """
+        beliefs, plausibilities = self.adapter.calculate_belief_plausibility_batch(data, ctx.supported_events)
+        if ctx.all_supported:
+            return dict(zip(ctx.event_keys, beliefs)), dict(zip(ctx.event_keys, plausibilities))
+
+        belief_by_key = ctx.zero_measures.copy()
+        belief_by_key.update(zip(ctx.supported_keys, beliefs))
+        plausibility_by_key = ctx.zero_measures.copy()
+        plausibility_by_key.update(zip(ctx.supported_keys, plausibilities))
+        return belief_by_key, plausibility_by_key
+
+    def _build_test_context(self, loaded_data: Any) -> TestContext:
+        """Строит frozenset-события (одиночные элементы + Ω), их строковые ключи и данные по источникам."""
+        frame_elements = self.adapter.get_frame_of_discernment(loaded_data)
+        omega = frozenset(frame_elements)
+        # Фрейм сортируется один раз на тест: строка Ω - ключ результатов и поле metadata
+        omega_event = _format_subset(omega)
+        events = tuple(frozenset((element,)) for element in frame_elements) + (omega,)
+        event_keys = tuple(f"{{{element}}}" for element in frame_elements) + (omega_event,)
+        sources = tuple(
+            self._get_source_data(loaded_data, i)
+            for i in range(self.adapter.get_sources_count(loaded_data))
+        )
+        # Маска поддерживаемых адаптером событий определяется один раз, а не try/except на событие
+        mask = self.adapter.supported_events(loaded_data, list(events))
+        supported = [(event, key) for event, key, ok in zip(events, event_keys, mask) if ok]
+        return TestContext(
+            loaded_data=loaded_data,
+            frame_elements=frame_elements,
+            omega=omega,
+            omega_event=omega_event,
+            events=events,
+            event_keys=event_keys,
+            sources=sources,
+            source_ids=tuple(f"source_{i+1}" for i in range(len(sources))),
+            supported_events=tuple(event for event, _ in supported),
+            supported_keys=tuple(key for _, key in supported),
+            all_supported=len(supported) == len(events),
+            zero_measures=dict.fromkeys(event_keys, 0.0),
+            # Ключи событий уже построены - обе таблицы подмножеств начинаются с них
+            subset_cache=_SubsetCache(zip(event_keys, events)),
+            subset_keys=_SubsetKeyCache(zip(events, event_keys)),
+        )
+
+    def _get_test_context(self, loaded_data: Any) -> TestContext:
+        """Возвращает контекст теста для loaded_data (строит лениво, если run_test его не подготовил)."""
+        ctx = self._test_context
+        if ctx is None or ctx.loaded_data is not loaded_data:
+            ctx = self._test_context = self._build_test_context(loaded_data)
+        return ctx
     
     def _convert_string_bpa_to_frozenset(self, bpa_str: Dict[str, float]) -> Dict[frozenset, float]:
         """Конвертирует BPA из строкового формата в формат frozenset."""
@@ -390,76 +753,87 @@ class UniversalBenchmarkRunner:
         if isinstance(first_key, frozenset):
             return bpa_str # type: ignore
         
-        # Конвертируем строки во frozenset
-        bpa_frozenset: Dict[frozenset, float] = {}
-        for subset_str, mass in bpa_str.items():
-            if subset_str == "{}":
-                subset = frozenset()
-            else:
-                elements = subset_str.strip("{}").split(",")
-                if elements == ['']:
-                    subset = frozenset()
-                else:
-                    subset = frozenset(elements)
-            bpa_frozenset[subset] = mass
-        
-        return bpa_frozenset
+        # Конвертируем строки во frozenset через кэш разобранных подмножеств теста
+        ctx = self._test_context
+        subset_cache = ctx.subset_cache if ctx is not None else _SubsetCache()
+        return dict(zip(map(subset_cache.__getitem__, bpa_str), bpa_str.values()))
         
     def _is_full_conflict_message(self, message: str) -> bool:
         lowered = str(message).lower()
         return any(keyword in lowered for keyword in ["полный конфликт", "full conflict", "k=1.0", "конфликт между источниками"])
 
     def _measure_performance(self, func: Callable, *args,
-                       step_name: str = "", **kwargs) -> Tuple[Any, Dict[str, Any]]:
-        """Измеряет производительность выполнения функции и нормализует статус этапа."""
+                       step_name: str = "", test_name: str = "", iteration: int = 1,
+                       **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        """Измеряет производительность выполнения функции и нормализует статус этапа.
+
+        test_name/iteration - контекст вызова (для подклассов), в func не передаются.
+        """
         metrics: Dict[str, Any] = {
             "status": "success",
             "supported": True,
         }
 
-        tracemalloc.start()
-        snapshot1 = tracemalloc.take_snapshot()
-
-        process = psutil.Process()
-        cpu_before = process.cpu_percent(interval=None)
-        start_time = time.perf_counter()
+        # tracemalloc перехватывает каждое выделение памяти и замедляет сам шаг,
+        # поэтому включается только по запросу; иначе - разница RSS до/после
+        if self.track_allocations:
+            # Уже идущую трассировку (например, профилировщика памяти) не перезапускаем и не останавливаем
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            traced_before, _ = tracemalloc.get_traced_memory()
+        else:
+            rss_before_kb = _rss_kb()
 
-        try:
-            result = func(*args, **kwargs)
-        except NotImplementedError as e:
-            metrics["status"] = "not_supported"
-            metrics["supported"] = False
-            metrics["error_type"] = type(e).__name__
-            metrics["error"] = str(e)
-            result = {"status": "not_supported", "error": str(e)}
-        except ValueError as e:
-            error_msg = str(e)
-            if self._is_full_conflict_message(error_msg):
-                metrics["status"] = "full_conflict"
-                metrics["warning"] = "Полный конфликт между источниками (K=1.0)"
-                metrics["full_conflict"] = True
-                result = {"status": "full_conflict", "warning": metrics["warning"]}
-            else:
+        # GC-паузы не должны попадать во время шага (при freeze_gc сборщик уже отключен на весь тест)
+        with _gc_paused(), _timed(metrics, "time_ms"):
+            # Процессорное время (user + system) в том же окне, что и perf_counter:
+            # разница с time_ms - ожидание (диск, сеть, планировщик), а не вычисления
+            cpu_start_ns = time.process_time_ns()
+            try:
+                result = func(*args, **kwargs)
+            except NotImplementedError as e:
+                metrics["status"] = "not_supported"
+                metrics["supported"] = False
+                metrics["error_type"] = type(e).__name__
+                metrics["error"] = str(e)
+                result = {"status": "not_supported", "error": str(e)}
+            except ValueError as e:
+                error_msg = str(e)
+                if self._is_full_conflict_message(error_msg):
+                    metrics["status"] = "full_conflict"
+                    metrics["warning"] = "Полный конфликт между источниками (K=1.0)"
+                    metrics["full_conflict"] = True
+                    result = {"status": "full_conflict", "warning": metrics["warning"]}
+                else:
+                    metrics["status"] = "failed"
+                    metrics["error_type"] = type(e).__name__
+                    metrics["error"] = error_msg
+                    result = {"status": "failed", "error": error_msg}
+            except Exception as e:
                 metrics["status"] = "failed"
                 metrics["error_type"] = type(e).__name__
-                metrics["error"] = error_msg
-                result = {"status": "failed", "error": error_msg}
-        except Exception as e:
-            metrics["status"] = "failed"
-            metrics["error_type"] = type(e).__name__
-            metrics["error"] = str(e)
-            result = {"status": "failed", "error": str(e)}
-
-        end_time = time.perf_counter()
-        cpu_after = process.cpu_percent(interval=None)
-        snapshot2 = tracemalloc.take_snapshot()
-        tracemalloc.stop()
-
-        metrics["time_ms"] = (end_time - start_time) * 1000
-        memory_stats = snapshot2.compare_to(snapshot1, 'lineno')
-        memory_usage = sum(stat.size for stat in memory_stats)
-        metrics["memory_peak_mb"] = memory_usage / 1024 / 1024
-        metrics["cpu_usage_percent"] = max(0, cpu_after - cpu_before)
+                metrics["error"] = str(e)
+                result = {"status": "failed", "error": str(e)}
+            cpu_end_ns = time.process_time_ns()
+
+        if self.track_allocations:
+            traced_after, peak_bytes = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            metrics["memory_delta_bytes"] = traced_after - traced_before
+            metrics["memory_peak_bytes"] = peak_bytes
+            metrics["memory_peak_mb"] = peak_bytes / 1024 / 1024
+        else:
+            # Пика шага RSS не дает: memory_peak_* пишутся только в режиме tracemalloc,
+            # здесь - разница и абсолютный RSS процесса после шага
+            rss_after_kb = _rss_kb()
+            metrics["memory_delta_bytes"] = (rss_after_kb - rss_before_kb) * 1024
+            metrics["rss_after_bytes"] = rss_after_kb * 1024
+        cpu_time_ms = (cpu_end_ns - cpu_start_ns) / 1e6
+        metrics["cpu_time_ms"] = cpu_time_ms
+        metrics["cpu_usage_percent"] = 100.0 * cpu_time_ms / metrics["time_ms"] if metrics["time_ms"] > 0 else 0.0
 
         return result, metrics
     
@@ -489,24 +863,19 @@ class UniversalBenchmarkRunner:
             bpa = source_data['bpas'][0]
             # Если BPA в формате frozenset, конвертируем в строковый формат
             if bpa and isinstance(next(iter(bpa.keys())), frozenset):
-                return self._convert_frozenset_bpa_to_string(bpa)
+                return self._convert_frozenset_bpa_to_string(bpa, self._get_test_context(loaded_data))
         
         return {}
     
-    def _convert_frozenset_bpa_to_string(self, bpa_frozenset: Dict[frozenset, float]) -> Dict[str, float]:
+    def _convert_frozenset_bpa_to_string(self, bpa_frozenset: Dict[frozenset, float],
+                                         ctx: Optional[TestContext] = None) -> Dict[str, float]:
         """Конвертирует BPA из формата frozenset в строковый формат."""
         if not bpa_frozenset:
             return {}
         
-        bpa_str = {}
-        for subset, mass in bpa_frozenset.items():
-            if not subset:
-                subset_str = "{}"
-            else:
-                subset_str = "{" + ",".join(sorted(subset)) + "}"
-            bpa_str[subset_str] = mass
-        
-        return bpa_str
+        # Строки подмножеств берутся из таблицы теста: сортировка и склейка - один раз на подмножество
+        subset_keys = ctx.subset_keys if ctx is not None else _SubsetKeyCache()
+        return dict(zip(map(subset_keys.__getitem__, bpa_frozenset), bpa_frozenset.values()))
     
     def _create_combined_data(self, original_data: Any, 
                             combined_bpa: Dict[frozenset, float]) -> Any:
@@ -547,13 +916,7 @@ class UniversalBenchmarkRunner:
             
             if step_times:
                 aggregated["performance"][step] = {
-                    "time_ms": {
-                        "min": min(step_times),
-                        "max": max(step_times),
-                        "mean": statistics.mean(step_times),
-                        "median": statistics.median(step_times),
-                        "std": statistics.stdev(step_times) if len(step_times) > 1 else 0
-                    }
+                    "time_ms": _time_stats(step_times)
                 }
         
         # Агрегация итогового времени
@@ -565,13 +928,7 @@ class UniversalBenchmarkRunner:
         
         if total_times:
             aggregated["performance"]["total"] = {
-                "time_total_ms": {
-                    "min": min(total_times),
-                    "max": max(total_times),
-                    "mean": statistics.mean(total_times),
-                    "median": statistics.median(total_times),
-                    "std": statistics.stdev(total_times) if len(total_times) > 1 else 0
-                }
+                "time_total_ms": _time_stats(total_times)
             }
         
         # Агрегация результатов вычислений
@@ -581,36 +938,61 @@ class UniversalBenchmarkRunner:
         return aggregated
     
     def _save_test_results(self, test_results: Dict[str, Any], test_name: str):
-        """Сохраняет структурированные результаты теста."""
-        self.artifact_manager.save_test_results(test_results, test_name)
+        """Сохраняет структурированные результаты теста.
+
+        Сырые итерации всех тестов дописываются строками в общий поток
+        test_results/iterations.jsonl, а в файл теста идут только метаданные и агрегаты.
+        """
+        self._write_test_results(*self._persisted_results(test_results, test_name), test_name)
+
+    @staticmethod
+    def _persisted_results(test_results: Dict[str, Any],
+                           test_name: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Строки iterations.jsonl и содержимое файла теста (новые dict, метаданные - копия)."""
+        iteration_records = [
+            {"test_name": test_name, **iteration} for iteration in test_results.get("iterations") or []
+        ]
+        persisted_results = {key: value for key, value in test_results.items() if key != "iterations"}
+        if "metadata" in persisted_results:
+            persisted_results["metadata"] = dict(persisted_results["metadata"])
+        persisted_results["iterations_ref"] = f"test_results/{_ITERATIONS_STREAM}"
+        return iteration_records, persisted_results
+
+    def _write_test_results(self, iteration_records: List[Dict[str, Any]],
+                            persisted_results: Dict[str, Any], test_name: str) -> None:
+        """Пишет подготовленные _persisted_results данные теста (выполняется в потоке писателя)."""
+        if iteration_records:
+            self.artifact_manager.append_jsonl(_ITERATIONS_STREAM, iteration_records, subdir="test_results")
+        self.artifact_manager.save_test_results(persisted_results, test_name)
 
     def _classify_test_status(self, test_result: Dict[str, Any]) -> str:
         if test_result.get("error"):
-            return "failed"
+            return STATUS_FAILED
 
         statuses: list[str] = []
         for iteration in test_result.get("iterations", []):
             perf = iteration.get("performance", {})
-            for step in ("step1", "step2", "step3", "step4"):
+            for step in STEP_KEYS:
                 step_perf = perf.get(step, {})
-                statuses.append(step_perf.get("status", "success"))
+                statuses.append(step_perf.get("status", STATUS_SUCCESS))
 
-        if any(status == "failed" for status in statuses):
-            return "failed"
-        if any(status == "full_conflict" for status in statuses):
-            return "full_conflict"
-        if statuses and all(status == "not_supported" for status in statuses):
-            return "not_supported"
-        return "success"
+        if any(status == STATUS_FAILED for status in statuses):
+            return STATUS_FAILED
+        if any(status == STATUS_FULL_CONFLICT for status in statuses):
+            return STATUS_FULL_CONFLICT
+        if statuses and all(status == STATUS_NOT_SUPPORTED for status in statuses):
+            return STATUS_NOT_SUPPORTED
+        return STATUS_SUCCESS
 
     def _create_run_summary(self, discovered_tests: int) -> Dict[str, Any]:
         """Создает единый сводный отчет по запуску с учетом всех итераций/повторов."""
-        step_map = {
-            "step1": "step1_original",
-            "step2": "step2_dempster",
-            "step3": "step3_discount_dempster",
-            "step4": "step4_yager",
-        }
+        step_map = dict(zip(STEP_KEYS, (
+            "step1_original",
+            "step2_dempster",
+            "step3_discount_dempster",
+            "step4_yager",
+        )))
+        step_items = tuple(step_map.items())
 
         run_summary: Dict[str, Any] = {
             "run_meta": {
@@ -621,73 +1003,77 @@ class UniversalBenchmarkRunner:
                 "executed_tests": len(self.results),
                 "run_dir": self.run_dir,
             },
-            "totals": {
-                "success": 0,
-                "failed": 0,
-                "full_conflict": 0,
-                "not_supported": 0,
-            },
-            "tests": [],
+            "totals": Counter({
+                STATUS_SUCCESS: 0,
+                STATUS_FAILED: 0,
+                STATUS_FULL_CONFLICT: 0,
+                STATUS_NOT_SUPPORTED: 0,
+            }),
+            "tests": [None] * len(self.results),
             "statistics": {
                 "steps": {},
-                "total_time_ms": {"sample_count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "median": 0.0, "std": 0.0},
-                "total_time_per_repeat_ms": {"sample_count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "median": 0.0, "std": 0.0},
+                "total_time_ms": dict(_EMPTY_STATS),
+                "total_time_per_repeat_ms": dict(_EMPTY_STATS),
                 "errors": {},
             },
         }
 
-        step_total_samples: Dict[str, list[float]] = {step: [] for step in step_map}
-        step_normalized_samples: Dict[str, list[float]] = {step: [] for step in step_map}
         step_counters: Dict[str, Dict[str, int]] = {
-            step: {"applicable": 0, "success": 0, "failed": 0, "full_conflict": 0, "not_supported": 0}
+            step: {
+                "applicable": 0,
+                STATUS_SUCCESS: 0,
+                STATUS_FAILED: 0,
+                STATUS_FULL_CONFLICT: 0,
+                STATUS_NOT_SUPPORTED: 0,
+            }
             for step in step_map
         }
-        total_times: list[float] = []
-        total_per_repeat_times: list[float] = []
-
-        def _stats(values: list[float]) -> Dict[str, float]:
-            if not values:
-                return {"sample_count": 0, "mean": 0.0, "min": 0.0, "max": 0.0, "median": 0.0, "std": 0.0}
-            return {
-                "sample_count": len(values),
-                "mean": statistics.mean(values),
-                "min": min(values),
-                "max": max(values),
-                "median": statistics.median(values),
-                "std": statistics.stdev(values) if len(values) > 1 else 0.0,
-            }
+        errors: Dict[str, set[str]] = defaultdict(set)
+
+        # Замеры всех итераций прогона - предвыделенные матрицы (итерация x шаг):
+        # строки теста идут подряд, выборки по шагам/тестам - срезы с маской успешных шагов
+        total_rows = sum(len(test_result.get("iterations", [])) for test_result in self.results)
+        step_total_matrix = np.zeros((total_rows, len(step_items)), dtype=np.float64)
+        step_normalized_matrix = np.zeros((total_rows, len(step_items)), dtype=np.float64)
+        step_ok_matrix = np.zeros((total_rows, len(step_items)), dtype=bool)
+        # Процессорное время шага; NaN - замер без cpu_time_ms (например, профилирующий раннер)
+        step_cpu_matrix = np.full((total_rows, len(step_items)), np.nan, dtype=np.float64)
 
-        for test_result in self.results:
+        def _stats(values: np.ndarray) -> Dict[str, float]:
+            if not values.size:
+                return dict(_EMPTY_STATS)
+            return {"sample_count": int(values.size), **_time_stats(values)}
+
+        def _row_totals(rows: slice) -> Tuple[np.ndarray, np.ndarray]:
+            """Суммарное время итераций, где успешны все шаги (всего и на повтор)."""
+            complete = step_ok_matrix[rows].all(axis=1)
+            return (
+                step_total_matrix[rows][complete].sum(axis=1),
+                step_normalized_matrix[rows][complete].sum(axis=1),
+            )
+
+        row = 0
+        for test_idx, test_result in enumerate(self.results):
             metadata = test_result.get("metadata", {})
             test_name = metadata.get("test_name", "unknown")
             iterations = test_result.get("iterations", [])
 
-            test_entry: Dict[str, Any] = {
-                "test_name": test_name,
-                "status": self._classify_test_status(test_result),
-                "frame_size": metadata.get("frame_size"),
-                "sources_count": metadata.get("sources_count"),
-                "input_ref": f"input/{test_name}_input.json",
-                "result_ref": f"test_results/{test_name}_results.json",
-                "iterations_count": len(iterations),
-                "steps": {},
-                "errors": [],
-            }
-
-            test_step_total_samples: Dict[str, list[float]] = {step: [] for step in step_map}
-            test_step_normalized_samples: Dict[str, list[float]] = {step: [] for step in step_map}
-            test_total_samples: list[float] = []
-            test_total_per_repeat_samples: list[float] = []
+            test_entry = TestEntry(
+                test_name=test_name,
+                status=self._classify_test_status(test_result),
+                frame_size=metadata.get("frame_size"),
+                sources_count=metadata.get("sources_count"),
+                input_ref=f"input/{test_name}_input.json",
+                result_ref=f"test_results/{test_name}_results.json",
+                iterations_count=len(iterations),
+            )
 
+            test_rows = slice(row, row + len(iterations))
             for iteration in iterations:
                 perf = iteration.get("performance", {})
-                successful_step_total_times: list[float] = []
-                successful_step_normalized_times: list[float] = []
-
-                for step_key, step_name in step_map.items():
+                for step_idx, (step_key, step_name) in enumerate(step_items):
                     step_perf = perf.get(step_key, {})
-                    status = step_perf.get("status", "success")
-                    supported = step_perf.get("supported", status != "not_supported")
+                    status = sys.intern(step_perf.get("status", STATUS_SUCCESS))
                     time_total_ms = float(step_perf.get("time_ms", 0.0) or 0.0)
                     repeat_count = int(step_perf.get("step_repeat_count", metadata.get("step_repeat_count", 1)) or 1)
                     time_per_repeat_ms = float(
@@ -695,70 +1081,80 @@ class UniversalBenchmarkRunner:
                     )
 
                     counters = step_counters[step_key]
-                    counters[status if status in counters else "failed"] += 1
-                    if status != "not_supported":
+                    counters[status if status in counters else STATUS_FAILED] += 1
+                    if status != STATUS_NOT_SUPPORTED:
                         counters["applicable"] += 1
 
-                    if status == "success":
-                        step_total_samples[step_key].append(time_total_ms)
-                        step_normalized_samples[step_key].append(time_per_repeat_ms)
-                        test_step_total_samples[step_key].append(time_total_ms)
-                        test_step_normalized_samples[step_key].append(time_per_repeat_ms)
-                        successful_step_total_times.append(time_total_ms)
-                        successful_step_normalized_times.append(time_per_repeat_ms)
+                    if status == STATUS_SUCCESS:
+                        step_total_matrix[row, step_idx] = time_total_ms
+                        step_normalized_matrix[row, step_idx] = time_per_repeat_ms
+                        step_ok_matrix[row, step_idx] = True
+                        cpu_time_ms = step_perf.get("cpu_time_ms")
+                        if cpu_time_ms is not None:
+                            step_cpu_matrix[row, step_idx] = cpu_time_ms
                     else:
                         error_message = step_perf.get("error") or step_perf.get("warning")
                         if error_message:
                             err_key = f"{step_name}: {error_message}"
-                            run_summary["statistics"]["errors"].setdefault(err_key, []).append(test_name)
-                            test_entry["errors"].append({
+                            errors[err_key].add(test_name)
+                            test_entry.errors.append({
                                 "iteration": iteration.get("iteration") or iteration.get("run"),
                                 "step": step_name,
                                 "status": status,
                                 "message": error_message,
                             })
+                row += 1
 
-                if len(successful_step_total_times) == 4:
-                    test_total = sum(successful_step_total_times)
-                    test_total_per_repeat = sum(successful_step_normalized_times)
-                    total_times.append(test_total)
-                    total_per_repeat_times.append(test_total_per_repeat)
-                    test_total_samples.append(test_total)
-                    test_total_per_repeat_samples.append(test_total_per_repeat)
-
-            for step_key, step_name in step_map.items():
-                test_entry["steps"][step_key] = {
+            test_ok = step_ok_matrix[test_rows]
+            for step_idx, (step_key, step_name) in enumerate(step_items):
+                ok = test_ok[:, step_idx]
+                if not ok.any():
+                    test_entry.steps[step_key] = {"name": step_name, "samples": _EMPTY_SAMPLES}
+                    continue
+                test_entry.steps[step_key] = {
                     "name": step_name,
                     "samples": {
-                        "time_total_ms": _stats(test_step_total_samples[step_key]),
-                        "time_per_repeat_ms": _stats(test_step_normalized_samples[step_key]),
+                        "time_total_ms": _stats(step_total_matrix[test_rows, step_idx][ok]),
+                        "time_per_repeat_ms": _stats(step_normalized_matrix[test_rows, step_idx][ok]),
                     },
                 }
 
-            test_entry["total_time_ms"] = _stats(test_total_samples)
-            test_entry["total_time_per_repeat_ms"] = _stats(test_total_per_repeat_samples)
+            test_totals, test_totals_per_repeat = _row_totals(test_rows)
+            test_entry.total_time_ms = _stats(test_totals)
+            test_entry.total_time_per_repeat_ms = _stats(test_totals_per_repeat)
 
-            run_summary["tests"].append(test_entry)
-            run_summary["totals"][test_entry["status"]] = run_summary["totals"].get(test_entry["status"], 0) + 1
+            run_summary["tests"][test_idx] = test_entry.to_dict()
+            run_summary["totals"][test_entry.status] += 1
 
-        for step_key, counters in step_counters.items():
+        for step_idx, (step_key, counters) in enumerate(step_counters.items()):
             applicable = counters["applicable"]
-            success_rate = (counters["success"] / applicable * 100) if applicable else 0.0
+            success_rate = (counters[STATUS_SUCCESS] / applicable * 100) if applicable else 0.0
+            ok = step_ok_matrix[:, step_idx]
             run_summary["statistics"]["steps"][step_key] = {
                 "counts": counters,
                 "success_rate": success_rate,
-                "time_total_ms": _stats(step_total_samples[step_key]),
-                "time_per_repeat_ms": _stats(step_normalized_samples[step_key]),
+                "time_total_ms": _stats(step_total_matrix[ok, step_idx]),
+                "time_per_repeat_ms": _stats(step_normalized_matrix[ok, step_idx]),
+                "cpu_time_ms": _stats(step_cpu_matrix[ok & ~np.isnan(step_cpu_matrix[:, step_idx]), step_idx]),
             }
 
+        total_times, total_per_repeat_times = _row_totals(slice(None))
         run_summary["statistics"]["total_time_ms"] = _stats(total_times)
         run_summary["statistics"]["total_time_per_repeat_ms"] = _stats(total_per_repeat_times)
+        run_summary["statistics"]["errors"] = {err_key: sorted(tests) for err_key, tests in errors.items()}
+        run_summary["totals"] = dict(run_summary["totals"])
         return run_summary
 
     def run_test_suite(self, test_dir: str,
                   iterations: int = 3,
-                  max_tests: Optional[int] = None) -> Dict[str, Any]:
-        """Запускает набор тестов из директории и формирует единый run-summary."""
+                  max_tests: Optional[int] = None,
+                  workers: int = 1) -> Dict[str, Any]:
+        """Запускает набор тестов из директории и формирует единый run-summary.
+
+        workers > 1 - тесты выполняются в пуле процессов (вычисления в воркерах,
+        запись артефактов - в основном процессе по мере готовности тестов,
+        сводка - в исходном порядке файлов).
+        """
         print("\n🚀 Запуск набора тестов")
         print(f"📁 Директория: {test_dir}")
         print(f"🔄 Итераций на тест: {iterations}")
@@ -779,114 +1175,190 @@ class UniversalBenchmarkRunner:
         if total_tests == 0:
             print("⚠️  Тесты не найдены — будет сформирован пустой run_summary.")
 
-        for i, test_file in enumerate(test_files, 1):
-            test_name = os.path.splitext(os.path.basename(test_file))[0]
-            self._render_inline_progress(f"🧪 [{i}/{total_tests}] {test_name} ...")
-            try:
-                with open(test_file, 'r', encoding='utf-8') as f:
-                    test_data = json.load(f)
-                if "frame_of_discernment" not in test_data or "bba_sources" not in test_data:
-                    raise ValueError("Неверный формат теста")
-                sources_count = len(test_data.get("bba_sources", []))
-                alphas = [0.1] * sources_count
-                self.run_test(test_data=test_data, test_name=test_name, iterations=iterations, alphas=alphas)
-                self._render_inline_progress(f"✅ [{i}/{total_tests}] {test_name}")
-                self._finish_inline_progress()
-            except Exception as e:
-                self._render_inline_progress(f"❌ [{i}/{total_tests}] {test_name}: {e}")
-                self._finish_inline_progress()
-                failed_test_result = {
-                    "metadata": {
-                        "test_name": test_name,
-                        "adapter": self.adapter_name,
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "failed_to_start"
-                    },
-                    "iterations": [],
-                    "aggregated": {},
-                    "error": str(e)
-                }
-                self._save_test_results(failed_test_result, test_name)
-                self.results.append(failed_test_result)
+        if workers > 1 and type(self).run_test is not UniversalBenchmarkRunner.run_test:
+            print(f"⚠️  {type(self).__name__} переопределяет run_test - тесты выполняются последовательно")
+            workers = 1
+
+        if workers > 1:
+            test_futures = self._submit_test_files(test_files, iterations, workers)
+        else:
+            test_futures = self._prefetch_test_files(test_files)
+
+        first_result_idx = len(self.results)
+        result_order: List[int] = []
+        self._in_suite = True
+        try:
+            for i, (test_pos, test_file, test_future) in enumerate(test_futures, 1):
+                result_order.append(test_pos)
+                test_name = os.path.splitext(os.path.basename(test_file))[0]
+                self._render_inline_progress(f"🧪 [{i}/{total_tests}] {test_name} ...")
+                try:
+                    if workers > 1:
+                        self._store_test_results(test_future.result(), test_name, input_path=test_file)
+                    else:
+                        test_data = test_future.result()
+                        self.run_test(
+                            test_data=test_data,
+                            test_name=test_name,
+                            iterations=iterations,
+                            alphas=_suite_test_alphas(test_data),
+                            input_path=test_file,
+                        )
+                    self._render_inline_progress(f"✅ [{i}/{total_tests}] {test_name}")
+                    self._finish_inline_progress()
+                except Exception as e:
+                    self._render_inline_progress(f"❌ [{i}/{total_tests}] {test_name}: {e}")
+                    self._finish_inline_progress()
+                    failed_test_result = {
+                        "metadata": {
+                            "test_name": test_name,
+                            "adapter": self.adapter_name,
+                            "timestamp": datetime.now().isoformat(),
+                            "status": "failed_to_start"
+                        },
+                        "iterations": [],
+                        "aggregated": {},
+                        "error": str(e)
+                    }
+                    self._submit_io(self._save_test_results, failed_test_result, test_name)
+                    self.results.append(failed_test_result)
+        finally:
+            self._in_suite = False
+
+        if workers > 1:
+            # Тесты завершаются в произвольном порядке - сводка строится в порядке файлов
+            suite_results = self.results[first_result_idx:]
+            self.results[first_result_idx:] = [
+                result for _, result in sorted(zip(result_order, suite_results), key=lambda item: item[0])
+            ]
 
+        self.flush_artifacts()
         run_summary = self._create_run_summary(discovered_tests=len(test_files))
-        self.artifact_manager.save_json("run_summary.json", run_summary, root_dir=True)
+        # Записи тестов кодируются по одной, без буфера всего отчета
+        self.artifact_manager.save_json_streamed("run_summary.json", run_summary, "tests", root_dir=True)
         self._create_final_text_report(run_summary)
 
         print("\n✅ Выполнение набора тестов завершено")
         return run_summary
 
+    def _prefetch_test_files(self, test_files: List[str]) -> Iterator[Tuple[int, str, Future]]:
+        """Отдает тестовые файлы по порядку, заранее загружая следующие в пуле потоков.
+
+        Сам тест выполняется в основном потоке; фоновые потоки только читают
+        и парсят JSON, скрывая задержку диска за вычислениями.
+        """
+        with ThreadPoolExecutor(max_workers=_TEST_PREFETCH_DEPTH) as pool:
+            pending: deque = deque(
+                pool.submit(_load_test_file, test_file)
+                for test_file in test_files[:_TEST_PREFETCH_DEPTH]
+            )
+            for idx, test_file in enumerate(test_files):
+                future = pending.popleft()
+                next_idx = idx + _TEST_PREFETCH_DEPTH
+                if next_idx < len(test_files):
+                    pending.append(pool.submit(_load_test_file, test_files[next_idx]))
+                yield idx, test_file, future
+
+    def _submit_test_files(self, test_files: List[str], iterations: int,
+                           workers: int) -> Iterator[Tuple[int, str, Future]]:
+        """Отправляет все тесты в пул процессов и отдает (позиция, файл, future) по мере завершения."""
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(_WORKER_START_METHOD),
+            initializer=_init_runner_worker,
+            initargs=(self.adapter_factory, self.track_allocations, self.freeze_gc, self.warmup),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_test_worker,
+                    test_file,
+                    os.path.splitext(os.path.basename(test_file))[0],
+                    iterations,
+                ): idx
+                for idx, test_file in enumerate(test_files)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                yield idx, test_files[idx], future
+
     def _create_final_text_report(self, run_summary: Dict[str, Any]):
-        """Создает финальный текстовый отчет из run_summary."""
+        """Создает финальный текстовый отчет из run_summary.
+
+        Строки пишутся сразу в общий буфер, без промежуточного списка и join.
+        """
         meta = run_summary.get("run_meta", {})
         totals = run_summary.get("totals", {})
         step_stats = run_summary.get("statistics", {}).get("steps", {})
         total_time = run_summary.get("statistics", {}).get("total_time_ms", {})
         total_time_per_repeat = run_summary.get("statistics", {}).get("total_time_per_repeat_ms", {})
 
-        lines = [
-            "=" * 90,
-            "📊 RUN SUMMARY",
-            f"Adapter: {meta.get('adapter', 'unknown')}",
-            f"Run ID: {meta.get('run_id', 'unknown')}",
-            f"Generated at: {meta.get('generated_at', '')}",
-            f"Discovered tests: {meta.get('discovered_tests', 0)}",
-            f"Executed tests: {meta.get('executed_tests', 0)}",
-            "=" * 90,
-            "",
-            "Totals:",
-            f"  ✅ success: {totals.get('success', 0)}",
-            f"  ⚠️ full_conflict: {totals.get('full_conflict', 0)}",
-            f"  🚫 not_supported: {totals.get('not_supported', 0)}",
-            f"  ❌ failed: {totals.get('failed', 0)}",
-            "",
-            "Step statistics:",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+
+        w("=" * 90 + "\n")
+        w("📊 RUN SUMMARY\n")
+        w(f"Adapter: {meta.get('adapter', 'unknown')}\n")
+        w(f"Run ID: {meta.get('run_id', 'unknown')}\n")
+        w(f"Generated at: {meta.get('generated_at', '')}\n")
+        w(f"Discovered tests: {meta.get('discovered_tests', 0)}\n")
+        w(f"Executed tests: {meta.get('executed_tests', 0)}\n")
+        w("=" * 90 + "\n")
+        w("\n")
+        w("Totals:\n")
+        w(f"  ✅ success: {totals.get(STATUS_SUCCESS, 0)}\n")
+        w(f"  ⚠️ full_conflict: {totals.get(STATUS_FULL_CONFLICT, 0)}\n")
+        w(f"  🚫 not_supported: {totals.get(STATUS_NOT_SUPPORTED, 0)}\n")
+        w(f"  ❌ failed: {totals.get(STATUS_FAILED, 0)}\n")
+        w("\n")
+        w("Step statistics:\n")
 
-        for step in ("step1", "step2", "step3", "step4"):
+        for step in STEP_KEYS:
             stat = step_stats.get(step, {})
             counts = stat.get("counts", {})
             time_total = stat.get("time_total_ms", {})
             time_per_repeat = stat.get("time_per_repeat_ms", {})
-            lines.append(
-                f"  {step}: applicable={counts.get('applicable', 0)}, success={counts.get('success', 0)}, "
-                f"failed={counts.get('failed', 0)}, full_conflict={counts.get('full_conflict', 0)}, "
-                f"not_supported={counts.get('not_supported', 0)}, success_rate={stat.get('success_rate', 0.0):.1f}%"
+            w(
+                f"  {step}: applicable={counts.get('applicable', 0)}, success={counts.get(STATUS_SUCCESS, 0)}, "
+                f"failed={counts.get(STATUS_FAILED, 0)}, full_conflict={counts.get(STATUS_FULL_CONFLICT, 0)}, "
+                f"not_supported={counts.get(STATUS_NOT_SUPPORTED, 0)}, success_rate={stat.get('success_rate', 0.0):.1f}%\n"
             )
-            lines.append(
+            w(
                 f"      time_total_ms: mean={time_total.get('mean', 0.0):.2f}, min={time_total.get('min', 0.0):.2f}, "
-                f"max={time_total.get('max', 0.0):.2f}, sample_count={time_total.get('sample_count', 0)}"
+                f"max={time_total.get('max', 0.0):.2f}, sample_count={time_total.get('sample_count', 0)}\n"
             )
-            lines.append(
+            w(
                 f"      time_per_repeat_ms: mean={time_per_repeat.get('mean', 0.0):.2f}, min={time_per_repeat.get('min', 0.0):.2f}, "
-                f"max={time_per_repeat.get('max', 0.0):.2f}, sample_count={time_per_repeat.get('sample_count', 0)}"
+                f"max={time_per_repeat.get('max', 0.0):.2f}, sample_count={time_per_repeat.get('sample_count', 0)}\n"
             )
 
-        lines.extend([
-            "",
-            "Total test time (only fully successful samples):",
+        w("\n")
+        w("Total test time (only fully successful samples):\n")
+        w(
             f"  total_ms: mean={total_time.get('mean', 0.0):.2f}, min={total_time.get('min', 0.0):.2f}, "
-            f"max={total_time.get('max', 0.0):.2f}, sample_count={total_time.get('sample_count', 0)}",
+            f"max={total_time.get('max', 0.0):.2f}, sample_count={total_time.get('sample_count', 0)}\n"
+        )
+        w(
             f"  per_repeat_ms: mean={total_time_per_repeat.get('mean', 0.0):.2f}, min={total_time_per_repeat.get('min', 0.0):.2f}, "
-            f"max={total_time_per_repeat.get('max', 0.0):.2f}, sample_count={total_time_per_repeat.get('sample_count', 0)}",
-            "",
-            "Errors:",
-        ])
+            f"max={total_time_per_repeat.get('max', 0.0):.2f}, sample_count={total_time_per_repeat.get('sample_count', 0)}\n"
+        )
+        w("\n")
+        w("Errors:\n")
 
         errors = run_summary.get("statistics", {}).get("errors", {})
         if not errors:
-            lines.append("  (none)")
+            w("  (none)\n")
         else:
             for error, tests in errors.items():
-                lines.append(f"  - {error}")
-                lines.append(f"    tests: {', '.join(sorted(set(tests)))}")
+                w(f"  - {error}\n")
+                w(f"    tests: {', '.join(tests)}\n")
 
-        self.artifact_manager.save_text("final_report.txt", "\n".join(lines), subdir="logs")
+        self.artifact_manager.save_text("final_report.txt", buf.getvalue(), subdir="logs")
 
     def cleanup(self):
         """Очистка ресурсов раннера.
         Может быть переопределен в подклассах для освобождения ресурсов.
         """
-        # Базовая реализация ничего не делает
+        # Базовая реализация дописывает артефакты из очереди и останавливает фоновый писатель
         # Подклассы могут переопределить для очистки файлов, соединений и т.д.
-        pass
+        self.flush_artifacts()
+        self._io_pool.shutdown(wait=True)